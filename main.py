@@ -5,17 +5,20 @@ A tool for managing RetroArch playlists and ROM collections
 """
 
 import argparse
-import json
+import os
 import sys
+import time
 from pathlib import Path
 
-from toolkit.config import Config
-from toolkit.core import ROMScanner, ROMMatcher, PlaylistGenerator, BaseFetcher
+from toolkit.config import Config, get_config
+
+# Command modules are imported inside each cmd_* handler so that --help and
+# light commands (init, config) don't load scanners, matchers and fetchers
 
 
 def cmd_init(args):
     """Initialize RetroArch configuration"""
-    config = Config()
+    config = get_config()
 
     retroarch_path = args.path
 
@@ -51,7 +54,9 @@ def cmd_init(args):
 
 def cmd_scan(args):
     """Scan ROM directory and match against database"""
-    config = Config()
+    from toolkit.core import ROMScanner, ROMMatcher
+
+    config = get_config()
 
     if not config.is_initialized():
         print("Error: RetroArch Toolkit not initialized. Run 'init' command first.")
@@ -59,10 +64,24 @@ def cmd_scan(args):
 
     scanner = ROMScanner(config)
 
-    # Progress callback
+    # Progress callback (lines are batched into one write per 100 ms or 100 ROMs,
+    # so fast cached scans don't pay for a write per ROM and slow ones still update)
+    progress_lines = []
+    last_flush = time.monotonic()
+
+    def flush_progress():
+        nonlocal last_flush
+        if progress_lines:
+            sys.stdout.write("".join(progress_lines))
+            sys.stdout.flush()
+            progress_lines.clear()
+        last_flush = time.monotonic()
+
     def show_progress(current, total, rom_info):
         if rom_info:
-            print(f"[{current}/{total}] Found: {rom_info.filename} ({rom_info.system})")
+            progress_lines.append(f"[{current}/{total}] Found: {rom_info.filename} ({rom_info.system})\n")
+            if len(progress_lines) >= 100 or time.monotonic() - last_flush >= 0.1:
+                flush_progress()
 
     # Scan path
     scan_path = args.path if args.path else None
@@ -77,8 +96,12 @@ def cmd_scan(args):
         path=scan_path,
         recursive=args.recursive,
         calculate_crc=calculate_crc,
-        progress_callback=show_progress if args.verbose else None
+        progress_callback=show_progress if args.verbose else None,
+        jobs=args.jobs,
+        parallel_per_file=args.parallel_per_file,
+        use_cache=not args.no_cache
     )
+    flush_progress()
 
     if not roms:
         print("No ROMs found!")
@@ -120,35 +143,34 @@ def cmd_scan(args):
 
 def cmd_match(args):
     """Interactively match unmatched ROMs from unknown_games.json"""
-    config = Config()
+    from toolkit.core import ROMMatcher
+    from toolkit.core.utils import load_json_file
+
+    config = get_config()
 
     if not config.is_initialized():
         print("Error: RetroArch Toolkit not initialized. Run 'init' command first.")
         return 1
 
     # Load unknown games
-    unknown_db_path = Path(config.get("unknown_games_db"))
+    unknown_db_path = config.unknown_games_db
     if not unknown_db_path.exists():
         print("No unknown games found. Run 'scan' command first.")
         return 1
 
-    with open(unknown_db_path, 'r', encoding='utf-8') as f:
-        unknown_games = json.load(f)
+    unknown_games = load_json_file(unknown_db_path)
 
     if not unknown_games:
         print("No unmatched games to fix.")
         return 0
 
-    # Load manual matches to avoid duplicates
-    manual_matches_path = Path(config.get("manual_matches_db", "manual_matches.json"))
-    already_matched = set()
-    if manual_matches_path.exists():
-        with open(manual_matches_path, 'r', encoding='utf-8') as f:
-            already_matched = set(json.load(f).keys())
-
     # Create matcher
     matcher = ROMMatcher(config)
 
+    # Load manual match keys to avoid duplicates
+    manual_matches_path = config.manual_matches_db
+    already_matched = matcher.load_manual_match_keys()
+
     print(f"\nFound {len(unknown_games)} unmatched ROM(s)")
     print(f"Already fixed: {len(already_matched)} ROM(s)")
 
@@ -171,28 +193,28 @@ def cmd_match(args):
 
 def cmd_playlist(args):
     """Generate RetroArch playlists"""
-    config = Config()
+    from toolkit.core import ROMScanner, ROMMatcher, PlaylistGenerator
+
+    config = get_config()
 
     if not config.is_initialized():
         print("Error: RetroArch Toolkit not initialized. Run 'init' command first.")
         return 1
 
-    # Scan and match ROMs
+    # Scan ROMs, matching each one as soon as it is hashed (if requested)
     scanner = ROMScanner(config)
-    print("Scanning ROMs...")
-    roms = scanner.scan(calculate_crc=True)
+    matcher = None if args.no_match else ROMMatcher(config)
+    print("Scanning ROMs..." if args.no_match else "Scanning and matching ROMs...")
+    roms = scanner.scan(
+        calculate_crc=True,
+        matcher=matcher,
+        auto_rename=config.get("scan_options.auto_rename", False)
+    )
 
     if not roms:
         print("No ROMs found")
         return 1
 
-    # Match ROMs if requested
-    if not args.no_match:
-        print("\nMatching ROMs to database...")
-        matcher = ROMMatcher(config)
-        auto_rename = config.get("scan_options.auto_rename", False)
-        matcher.match_all_roms(roms, auto_rename=auto_rename)
-
     # Generate playlists
     print("\nGenerating playlists...")
     generator = PlaylistGenerator(config)
@@ -207,7 +229,9 @@ def cmd_playlist(args):
 
 def cmd_download_db(args):
     """Download RetroArch databases"""
-    config = Config()
+    from toolkit.core import BaseFetcher
+
+    config = get_config()
 
     fetcher = BaseFetcher(config)
     db_fetcher = fetcher.get_plugin("retroarch_db")
@@ -216,7 +240,7 @@ def cmd_download_db(args):
         print("Error: RetroArch DB fetcher not available")
         return 1
 
-    output_dir = Path(args.output) if args.output else Path(config.get("database_path"))
+    output_dir = Path(args.output) if args.output else config.database_path
 
     if args.list:
         # List available databases
@@ -228,7 +252,7 @@ def cmd_download_db(args):
 
     # Download databases
     systems = args.systems if args.systems else None
-    results = db_fetcher.download_all_databases(output_dir=output_dir, systems=systems)
+    results = db_fetcher.download_all_databases(output_dir=output_dir, systems=systems, update=args.update)
 
     # Summary
     successful = sum(1 for r in results.values() if r.success)
@@ -239,20 +263,23 @@ def cmd_download_db(args):
 
 def cmd_download_thumbnails(args):
     """Download game thumbnails from LaunchBox first, fallback to libretro_thumbnails"""
-    config = Config()
+    from concurrent.futures import ThreadPoolExecutor
+    from toolkit.core import BaseFetcher
+    from toolkit.core.utils import ARCADE_SYSTEMS, load_json_file
+
+    config = get_config()
 
     if not config.is_initialized():
         print("Error: RetroArch Toolkit not initialized. Run 'init' command first.")
         return 1
 
     # Load manual matches
-    manual_matches_path = Path(config.get("manual_matches_db", "manual_matches.json"))
+    manual_matches_path = config.manual_matches_db
     if not manual_matches_path.exists():
         print("No manual matches found. Run 'match' command first.")
         return 1
 
-    with open(manual_matches_path, 'r', encoding='utf-8') as f:
-        manual_matches = json.load(f)
+    manual_matches = load_json_file(manual_matches_path)
 
     if not manual_matches:
         print("No matched games found.")
@@ -269,55 +296,64 @@ def cmd_download_thumbnails(args):
         print("Error: Libretro thumbnails fetcher not available")
         return 1
 
-    output_dir = Path(config.get("thumbnails_path"))
+    output_dir = config.thumbnails_path
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Download thumbnails for each matched game
-    success_count = 0
-    failed_count = 0
-    libretro_fallback_count = 0
-    total_images = 0
-
     # Image types to download (RetroArch standard types)
     launchbox_image_types = ["box_front", "screenshot_title", "screenshot_gameplay"]
     libretro_thumbnail_types = ["Named_Boxarts", "Named_Titles", "Named_Snaps"]
 
-    # Arcade systems that require specific ROM filenames
-    arcade_systems = [
-        "SNK - Neo Geo",
-        "MAME",
-        "FBNeo - Arcade Games",
-        "Arcade"
-    ]
+    # Per-download spinners would interleave across worker threads
+    # (libretro thumbnail types are always fetched concurrently)
+    jobs = max(1, args.jobs)
+    libretro_thumbnails.show_progress = False
+    if launchbox and jobs > 1:
+        launchbox.show_progress = False
+
+    # Create system-specific output directories up front, once per system,
+    # so worker threads only read this dict
+    system_output_dirs = {}
+    for match in manual_matches.values():
+        system = match.get('system', 'Unknown')
+        if system not in system_output_dirs:
+            system_output_dirs[system] = output_dir / system
+            system_output_dirs[system].mkdir(parents=True, exist_ok=True)
+
+    def download_game(match):
+        """Download thumbnails for one matched game
+
+        Output lines are buffered so concurrent games print as whole blocks.
 
-    for crc, match in manual_matches.items():
+        Returns:
+            Tuple of (output lines, success, images downloaded, used libretro fallback)
+        """
+        lines = []
         filename = match.get('filename', 'Unknown')
         system = match.get('system', 'Unknown')
         matched_name = match.get('matched_name', '')
 
         # Extract ROM filename without extension
-        rom_name = Path(filename).stem
+        rom_name = os.path.splitext(filename)[0]
 
         # For arcade systems, use ROM filename as output; for others use matched_name
-        is_arcade = system in arcade_systems
+        is_arcade = system in ARCADE_SYSTEMS
         thumbnail_output_name = rom_name if is_arcade else None
 
-        print(f"\nProcessing: {rom_name}")
-        print(f"  System: {system}")
+        lines.append(f"\nProcessing: {rom_name}")
+        lines.append(f"  System: {system}")
         if is_arcade:
-            print(f"  (Arcade system - using ROM filename for thumbnails)")
+            lines.append(f"  (Arcade system - using ROM filename for thumbnails)")
 
-        # Create system-specific output directory
-        system_output_dir = output_dir / system
-        system_output_dir.mkdir(parents=True, exist_ok=True)
+        system_output_dir = system_output_dirs[system]
 
         game_success = False
+        used_fallback = False
         downloaded_count = 0
 
         # Try LaunchBox first if available
         if launchbox and match.get('source') == 'launchbox' and match.get('launchbox_id'):
             game_id = match.get('launchbox_id')
-            print(f"  Trying LaunchBox (ID: {game_id})...")
+            lines.append(f"  Trying LaunchBox (ID: {game_id})...")
 
             result = launchbox.download_game_images(
                 game_id=game_id,
@@ -331,49 +367,64 @@ def cmd_download_thumbnails(args):
                 paths = result.data.get('paths', {})
                 count = result.data.get('count', 0)
                 downloaded_count += count
-                total_images += count
                 game_success = True
 
-                print(f"  ✓ LaunchBox: Downloaded {count} image(s)")
+                lines.append(f"  ✓ LaunchBox: Downloaded {count} image(s)")
                 if 'box_front' in paths:
-                    print(f"    - Named_Boxarts/{rom_name}.png")
+                    lines.append(f"    - Named_Boxarts/{rom_name}.png")
                 if 'screenshot_title' in paths:
-                    print(f"    - Named_Titles/{rom_name}.png")
+                    lines.append(f"    - Named_Titles/{rom_name}.png")
                 if 'screenshot_gameplay' in paths:
-                    print(f"    - Named_Snaps/{rom_name}.png")
+                    lines.append(f"    - Named_Snaps/{rom_name}.png")
             else:
-                print(f"  ✗ LaunchBox failed: {result.error}")
+                lines.append(f"  ✗ LaunchBox failed: {result.error}")
 
         # Fallback to libretro_thumbnails using matched_name
         if not game_success and matched_name:
-            print(f"  Trying libretro_thumbnails (search: {matched_name})...")
-
-            for thumbnail_type in libretro_thumbnail_types:
-                type_output_dir = system_output_dir / thumbnail_type
-                result = libretro_thumbnails.download_thumbnail(
-                    system=system,
-                    game_name=matched_name,
-                    thumbnail_type=thumbnail_type,
-                    output_dir=type_output_dir,
-                    output_filename=thumbnail_output_name
-                )
+            lines.append(f"  Trying libretro_thumbnails (search: {matched_name})...")
 
+            results = libretro_thumbnails.download_thumbnails(
+                system=system,
+                game_name=matched_name,
+                thumbnail_types=libretro_thumbnail_types,
+                output_dir=system_output_dir,
+                output_filename=thumbnail_output_name
+            )
+
+            for thumbnail_type, result in results.items():
                 if result.success:
                     downloaded_count += 1
-                    total_images += 1
                     game_success = True
                     status = "cached" if result.cached else "downloaded"
                     saved_as = thumbnail_output_name if thumbnail_output_name else matched_name
-                    print(f"  ✓ {thumbnail_type} ({status}) -> {saved_as}")
+                    lines.append(f"  ✓ {thumbnail_type} ({status}) -> {saved_as}")
 
-            if game_success:
+            used_fallback = game_success
+
+        if not game_success:
+            lines.append(f"  ✗ No thumbnails found from any source")
+
+        return lines, game_success, downloaded_count, used_fallback
+
+    # Download thumbnails for each matched game (network bound, so run concurrently)
+    success_count = 0
+    failed_count = 0
+    libretro_fallback_count = 0
+    total_images = 0
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        for lines, game_success, downloaded_count, used_fallback in executor.map(download_game, manual_matches.values()):
+            print("\n".join(lines))
+            total_images += downloaded_count
+            if used_fallback:
                 libretro_fallback_count += 1
+            if game_success:
+                success_count += 1
+            else:
+                failed_count += 1
 
-        if game_success:
-            success_count += 1
-        else:
-            print(f"  ✗ No thumbnails found from any source")
-            failed_count += 1
+    # Remember thumbnails that do not exist so re-runs skip the requests
+    libretro_thumbnails.save_misses()
 
     print(f"\n{'='*60}")
     print(f"Thumbnail Download Summary")
@@ -392,7 +443,7 @@ def cmd_download_thumbnails(args):
 
 def cmd_config(args):
     """Manage configuration"""
-    config = Config()
+    config = get_config()
 
     if args.show:
         # Show current configuration
@@ -409,6 +460,7 @@ def cmd_config(args):
         key, value = args.set.split('=', 1)
         config.set(key, value)
         config.save()
+        Config.invalidate()
         print(f"Set {key} = {value}")
 
     elif args.validate:
@@ -432,6 +484,7 @@ def main():
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
 
+    parser.set_defaults(func=None, verbose=False)
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
 
     # Init command
@@ -439,24 +492,31 @@ def main():
     parser_init.add_argument('path', nargs='?', help='RetroArch installation path (local working directory)')
     parser_init.add_argument('-r', '--runtime-path', help='Runtime ROMs path for playlists (e.g., Switch mount point)')
     parser_init.add_argument('--no-runtime', action='store_true', help='Skip runtime path configuration')
+    parser_init.set_defaults(func=cmd_init)
 
     # Scan command
     parser_scan = subparsers.add_parser('scan', help='Scan ROM directory and match against database')
     parser_scan.add_argument('-p', '--path', help='Path to scan (uses config roms_path if not specified)')
     parser_scan.add_argument('-r', '--recursive', action='store_true', default=True, help='Scan subdirectories')
     parser_scan.add_argument('--no-crc', action='store_true', help='Skip CRC32 calculation')
+    parser_scan.add_argument('-j', '--jobs', type=int, help='Number of parallel CRC32 workers (default: scan_options.jobs)')
+    parser_scan.add_argument('--no-cache', action='store_true', help='Recalculate every CRC32 instead of using the CRC cache')
+    parser_scan.add_argument('--parallel-per-file', action='store_true', help='Also hash large (64 MB+) ROMs in parallel parts')
     parser_scan.add_argument('-o', '--output', help='Export scan results to JSON file')
     parser_scan.add_argument('-v', '--verbose', action='store_true', help='Verbose output')
     parser_scan.add_argument('--auto-rename', action='store_true', help='Automatically rename matched ROMs to their game names')
+    parser_scan.set_defaults(func=cmd_scan)
 
     # Match command (interactive shell)
     parser_match = subparsers.add_parser('match', help='Interactively match unmatched ROMs from unknown_games.json')
     parser_match.add_argument('--auto-rename', action='store_true', help='Automatically rename matched ROMs to their game names')
+    parser_match.set_defaults(func=cmd_match)
 
     # Playlist command
     parser_playlist = subparsers.add_parser('build', help='Generate RetroArch playlists')
     parser_playlist.add_argument('--no-match', action='store_true', help='Skip database matching')
     parser_playlist.add_argument('--single', action='store_true', help='Create single playlist for all ROMs')
+    parser_playlist.set_defaults(func=cmd_playlist)
 
     # Get command (with subcommands for db and thumbnails)
     parser_get = subparsers.add_parser('get', help='Download resources (db, thumbnails)')
@@ -467,15 +527,21 @@ def main():
     parser_db.add_argument('-l', '--list', action='store_true', help='List available databases')
     parser_db.add_argument('-s', '--systems', nargs='+', help='Systems to download (downloads all if not specified)')
     parser_db.add_argument('-o', '--output', help='Output directory')
+    parser_db.add_argument('-u', '--update', action='store_true',
+                           help='Re-check existing databases and download only those that changed')
+    parser_db.set_defaults(func=cmd_download_db)
 
     # Get thumbnails subcommand
     parser_thumbnails = get_subparsers.add_parser('thumbnails', help='Download game thumbnails')
+    parser_thumbnails.add_argument('-j', '--jobs', type=int, default=8, help='Number of games to download concurrently (default: 8)')
+    parser_thumbnails.set_defaults(func=cmd_download_thumbnails)
 
     # Config command
     parser_config = subparsers.add_parser('config', help='Manage configuration')
     parser_config.add_argument('--show', action='store_true', help='Show current configuration')
     parser_config.add_argument('--set', help='Set configuration value (format: key=value)')
     parser_config.add_argument('--validate', action='store_true', help='Validate configuration')
+    parser_config.set_defaults(func=cmd_config)
 
     args = parser.parse_args()
 
@@ -483,42 +549,22 @@ def main():
         parser.print_help()
         return 0
 
+    # 'get' without a resource has no handler
+    if args.func is None:
+        parser_get.print_help()
+        return 0
+
     # Execute command
-    commands = {
-        'init': cmd_init,
-        'scan': cmd_scan,
-        'match': cmd_match,
-        'build': cmd_playlist,
-        'config': cmd_config,
-    }
-
-    # Handle 'get' command with subcommands
-    if args.command == 'get':
-        get_commands = {
-            'db': cmd_download_db,
-            'thumbnails': cmd_download_thumbnails,
-        }
-        if not args.get_command:
-            parser.parse_args(['get', '--help'])
-            return 0
-        command_func = get_commands.get(args.get_command)
-    else:
-        command_func = commands.get(args.command)
-
-    if command_func:
-        try:
-            return command_func(args)
-        except KeyboardInterrupt:
-            print("\n\nOperation cancelled by user")
-            return 130
-        except Exception as e:
-            print(f"Error: {e}")
-            if args.command in ['scan', 'match'] and hasattr(args, 'verbose') and args.verbose:
-                import traceback
-                traceback.print_exc()
-            return 1
-    else:
-        print(f"Unknown command: {args.command}")
+    try:
+        return args.func(args)
+    except KeyboardInterrupt:
+        print("\n\nOperation cancelled by user")
+        return 130
+    except Exception as e:
+        print(f"Error: {e}")
+        if args.verbose:
+            import traceback
+            traceback.print_exc()
         return 1
 
 
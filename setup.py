@@ -2,7 +2,7 @@
 Setup script for RetroArch Toolkit
 """
 
-from setuptools import setup, find_packages
+from setuptools import setup
 from pathlib import Path
 
 # Read README
@@ -17,11 +17,12 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/puterjam/retroarch-playlist-tools",
-    packages=find_packages(),
+    packages=["toolkit", "toolkit.core", "toolkit.plugins"],
     package_data={
         "": ["config/*.json", "config/libretro-core-info/*.info"],
     },
     include_package_data=True,
+    zip_safe=False,
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: End Users/Desktop",
@@ -39,6 +40,7 @@ setup(
     ],
     extras_require={
         "7z": ["py7zr>=0.20.0"],  # For 7z file support
+        "fast": ["orjson>=3.6.0", "rapidfuzz>=3.0.0", "isal>=1.0.0"],  # Faster JSON, fuzzy matching and CRC32
     },
     entry_points={
         "console_scripts": [
@@ -6,13 +6,21 @@ A tool for managing RetroArch playlists and ROM collections
 __version__ = "1.0.0"
 __author__ = "RetroArch Toolkit Contributors"
 
-from .config import Config
-from .core import ROMScanner, ROMMatcher, PlaylistGenerator, BaseFetcher
+from .config import Config, get_config
 
 __all__ = [
     'Config',
+    'get_config',
     'ROMScanner',
     'ROMMatcher',
     'PlaylistGenerator',
     'BaseFetcher'
 ]
+
+
+def __getattr__(name):
+    """Import core classes on first access to keep package import cheap"""
+    if name in ('ROMScanner', 'ROMMatcher', 'PlaylistGenerator', 'BaseFetcher'):
+        from . import core
+        return getattr(core, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
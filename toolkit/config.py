@@ -3,15 +3,96 @@ RetroArch Toolkit Configuration Module
 Handles configuration loading, saving, and validation
 """
 
+import hashlib
 import json
 import os
+import sys
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the stdlib json module
+    orjson = None
+
+# Marks a key that Config.get() found missing
+_MISSING = object()
+
+
+def _parse_json(data: bytes) -> Any:
+    """Parse a JSON document, using orjson when it is installed
+
+    Args:
+        data: Encoded JSON document
+
+    Returns:
+        Parsed JSON data
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _read_json(path: Path) -> Any:
+    """Parse a JSON file, using orjson when it is installed
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        Parsed JSON data
+    """
+    return _parse_json(Path(path).read_bytes())
+
+
+def _dump_json(data: Any) -> bytes:
+    """Serialize data as UTF-8 JSON indented by 4 spaces
+
+    Uses the stdlib json module since orjson only supports 2-space indents
+    and config.json has always been written with 4.
+
+    Args:
+        data: JSON-serializable data
+
+    Returns:
+        Encoded JSON document
+    """
+    return json.dumps(data, indent=4, ensure_ascii=False).encode('utf-8')
+
+
+def _digest(data: bytes) -> bytes:
+    """Hash a serialized config to detect unchanged saves"""
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _normalize_core_strings(system_defaults: dict) -> dict:
+    """Lowercase extensions and intern them and system names
+
+    Interning lets repeated strings share one object; lowercasing here means
+    extension lookups never have to lowercase the configured values.
+
+    Args:
+        system_defaults: Parsed cores.json data, modified in place
+
+    Returns:
+        The same dictionary
+    """
+    cores = system_defaults.get("cores")
+    if isinstance(cores, dict):
+        for core_config in cores.values():
+            core_config["extensions"] = [sys.intern(ext.lower()) for ext in core_config.get("extensions", [])]
+        system_defaults["cores"] = {sys.intern(name): core_config for name, core_config in cores.items()}
+    return system_defaults
 
 
 class Config:
     """Configuration manager for RetroArch Toolkit"""
 
+    # Keys also exposed as cached Path attributes (e.g. config.roms_path)
+    PATH_KEYS = ("roms_path", "playlists_path", "thumbnails_path", "database_path",
+                 "unknown_games_db", "manual_matches_db")
+
     @staticmethod
     def _load_system_defaults() -> dict:
         """Load default system configurations from external file
@@ -24,8 +105,7 @@ class Config:
 
         if config_file.exists():
             try:
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return _normalize_core_strings(_read_json(config_file))
             except Exception as e:
                 print(f"Warning: Could not load cores config: {e}")
 
@@ -55,14 +135,21 @@ class Config:
                 "match_hack_versions": True,
                 "download_thumbnails": True,
                 "create_playlists": True,
-                "auto_rename": False
+                "auto_rename": False,
+                "jobs": 4
             }
         }
 
-    @property
-    def DEFAULT_CONFIG(self) -> dict:
-        """Get default configuration with system defaults loaded from file"""
-        system_defaults = self._load_system_defaults()
+    @staticmethod
+    def _build_default(system_defaults: dict) -> dict:
+        """Build the default configuration from already loaded system defaults
+
+        Args:
+            system_defaults: Result of _load_system_defaults()
+
+        Returns:
+            Default configuration dictionary
+        """
         # Data directory paths will be set in _load_config
         return {
             "retroarch_path": "",
@@ -76,6 +163,14 @@ class Config:
             "scan_options": system_defaults.get("scan_options", {})
         }
 
+    @cached_property
+    def DEFAULT_CONFIG(self) -> dict:
+        """Get default configuration with system defaults loaded from file
+
+        cores.json is read once per instance; treat the result as read-only.
+        """
+        return self._build_default(self._load_system_defaults())
+
     def __init__(self, config_path: Optional[str] = None):
         """Initialize configuration
 
@@ -91,46 +186,92 @@ class Config:
         self.config_dir = self.config_path.parent
         self.data_dir = self.config_dir / "data"
         self.data_dir.mkdir(parents=True, exist_ok=True)
+        self._get_cache: Dict[str, Any] = {}  # Resolved dot-notation lookups
+        self._initialized: Optional[bool] = None  # Cached is_initialized() result
+        self._saved_digest: Optional[bytes] = None  # Hash of config.json as last read or written
         self.config = self._load_config()
+        self._build_extension_index()
 
     def _load_config(self) -> Dict:
         """Load configuration from file or create default"""
+        config = self._build_default(self._load_system_defaults())
+
         if self.config_path.exists():
             try:
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    loaded_config = json.load(f)
-                    # Merge with default config to ensure all keys exist
-                    merged = self._merge_configs(self.DEFAULT_CONFIG.copy(), loaded_config)
-                    # Always use cores and fetch_sources from cores.json (don't let user config override)
-                    system_defaults = self._load_system_defaults()
-                    merged['cores'] = system_defaults.get('cores', {})
-                    merged['fetch_sources'] = system_defaults.get('fetch_sources', {})
-                    # Set data file paths to data directory
-                    merged['unknown_games_db'] = str(self.data_dir / "unknown_games.json")
-                    merged['manual_matches_db'] = str(self.data_dir / "manual_matches.json")
-                    return merged
+                raw = self.config_path.read_bytes()
+                # A save() that would write back the same bytes can be skipped
+                self._saved_digest = _digest(raw)
+                loaded_config = _parse_json(raw)
+                # Always use cores and fetch_sources from cores.json (don't let user config override)
+                loaded_config.pop('cores', None)
+                loaded_config.pop('fetch_sources', None)
+                # Merge with default config to ensure all keys exist
+                self._merge_configs(config, loaded_config)
             except json.JSONDecodeError as e:
                 print(f"Error loading config: {e}")
                 print("Using default configuration")
-                config = self.DEFAULT_CONFIG.copy()
-                config['unknown_games_db'] = str(self.data_dir / "unknown_games.json")
-                config['manual_matches_db'] = str(self.data_dir / "manual_matches.json")
-                return config
-        else:
-            config = self.DEFAULT_CONFIG.copy()
-            config['unknown_games_db'] = str(self.data_dir / "unknown_games.json")
-            config['manual_matches_db'] = str(self.data_dir / "manual_matches.json")
-            return config
+
+        # Set data file paths to data directory
+        config['unknown_games_db'] = str(self.data_dir / "unknown_games.json")
+        config['manual_matches_db'] = str(self.data_dir / "manual_matches.json")
+        config['crc_cache_db'] = str(self.data_dir / "crc_cache.json")
+        return config
 
     def _merge_configs(self, base: Dict, override: Dict) -> Dict:
-        """Recursively merge configurations"""
-        for key, value in override.items():
-            if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-                base[key] = self._merge_configs(base[key], value)
-            else:
-                base[key] = value
+        """Merge override into base in place, descending into nested dicts"""
+        stack = [(base, override)]
+        while stack:
+            target, source = stack.pop()
+            for key, value in source.items():
+                current = target.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    stack.append((current, value))
+                else:
+                    target[key] = value
         return base
 
+    @cached_property
+    def roms_path(self) -> Path:
+        """Local ROMs directory"""
+        return Path(self.config["roms_path"])
+
+    @cached_property
+    def playlists_path(self) -> Path:
+        """Playlists directory"""
+        return Path(self.config["playlists_path"])
+
+    @cached_property
+    def thumbnails_path(self) -> Path:
+        """Thumbnails directory"""
+        return Path(self.config["thumbnails_path"])
+
+    @cached_property
+    def database_path(self) -> Path:
+        """Game database (RDB) directory"""
+        return Path(self.config["database_path"])
+
+    @cached_property
+    def unknown_games_db(self) -> Path:
+        """Path to unknown_games.json"""
+        return Path(self.config["unknown_games_db"])
+
+    @cached_property
+    def manual_matches_db(self) -> Path:
+        """Path to manual_matches.json"""
+        return Path(self.config["manual_matches_db"])
+
+    def _clear_caches(self) -> None:
+        """Drop cached Path attributes and lookups after config values change"""
+        for key in self.PATH_KEYS:
+            self.__dict__.pop(key, None)
+        self._get_cache.clear()
+        self._initialized = None
+
+    @staticmethod
+    def invalidate() -> None:
+        """Drop the shared instance so the next get_config() reloads from disk"""
+        get_config.cache_clear()
+
     def save(self) -> bool:
         """Save current configuration to file
 
@@ -138,9 +279,17 @@ class Config:
             True if successful, False otherwise
         """
         try:
+            payload = _dump_json(self.config)
+            digest = _digest(payload)
+            if digest == self._saved_digest and self.config_path.exists():
+                return True
+
+            # Write to a temporary file first so a crash never leaves a truncated config
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=4, ensure_ascii=False)
+            tmp_path = self.config_path.with_suffix('.tmp')
+            tmp_path.write_bytes(payload)
+            os.replace(tmp_path, self.config_path)
+            self._saved_digest = digest
             return True
         except Exception as e:
             print(f"Error saving config: {e}")
@@ -178,6 +327,8 @@ class Config:
             # If not specified, use same as roms_path
             self.config["roms_path_runtime"] = self.config["roms_path"]
 
+        self._clear_caches()
+
         # Create directories if they don't exist
         for path_key in ["roms_path", "playlists_path", "thumbnails_path", "database_path"]:
             path = Path(self.config[path_key])
@@ -204,7 +355,7 @@ class Config:
         # Replace local roms path with runtime roms path
         try:
             local_path = Path(local_rom_path)
-            local_base = Path(local_roms_path)
+            local_base = self.roms_path
 
             # Get relative path from roms directory
             relative_path = local_path.relative_to(local_base)
@@ -227,16 +378,18 @@ class Config:
         Returns:
             Configuration value
         """
-        keys = key.split('.')
-        value = self.config
-
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
-
-        return value
+        if key not in self._get_cache:
+            value = self.config
+            for k in key.split('.'):
+                if isinstance(value, dict) and k in value:
+                    value = value[k]
+                else:
+                    value = _MISSING
+                    break
+            self._get_cache[key] = value
+
+        value = self._get_cache[key]
+        return default if value is _MISSING else value
 
     def set(self, key: str, value) -> None:
         """Set configuration value
@@ -254,6 +407,30 @@ class Config:
             config = config[k]
 
         config[keys[-1]] = value
+        self._clear_caches()
+        if keys[0] == "cores":
+            self._build_extension_index()
+
+    def _build_extension_index(self) -> None:
+        """Index core configurations by file extension
+
+        Extensions are already lowercase (see _normalize_core_strings). A system
+        whose primary (first) extension matches wins over systems that merely
+        support it, so .gbc maps to GBC rather than GB.
+        """
+        primary = {}
+        fallback = {}
+        for system_name, core_config in self.config["cores"].items():
+            entry = {"system_name": system_name, **core_config}
+            extensions = core_config["extensions"]
+            if extensions:
+                primary.setdefault(extensions[0], entry)
+            for ext in extensions:
+                fallback.setdefault(ext, entry)
+
+        self._primary_extensions = primary
+        self._fallback_extensions = fallback
+        self._all_extensions = frozenset(fallback)
 
     def get_core_by_extension(self, extension: str) -> Optional[Dict]:
         """Get core configuration by file extension
@@ -265,26 +442,7 @@ class Config:
             Core configuration dict or None if not found
         """
         extension = extension.lower()
-
-        # First pass: Try to find systems where this extension is the primary (first) extension
-        # This handles cases like .gbc which should match GBC, not GB
-        for system_name, core_config in self.config["cores"].items():
-            extensions = [ext.lower() for ext in core_config["extensions"]]
-            if extensions and extensions[0] == extension:
-                return {
-                    "system_name": system_name,
-                    **core_config
-                }
-
-        # Second pass: Fall back to any system that supports this extension
-        for system_name, core_config in self.config["cores"].items():
-            if extension in [ext.lower() for ext in core_config["extensions"]]:
-                return {
-                    "system_name": system_name,
-                    **core_config
-                }
-
-        return None
+        return self._primary_extensions.get(extension) or self._fallback_extensions.get(extension)
 
     def get_all_extensions(self) -> List[str]:
         """Get all supported file extensions
@@ -292,10 +450,15 @@ class Config:
         Returns:
             List of file extensions
         """
-        extensions = []
-        for core_config in self.config["cores"].values():
-            extensions.extend(core_config["extensions"])
-        return list(set(extensions))
+        return list(self._all_extensions)
+
+    def get_all_extensions_set(self) -> frozenset:
+        """Get all supported file extensions for membership tests
+
+        Returns:
+            Frozen set of lowercase file extensions
+        """
+        return self._all_extensions
 
     def is_initialized(self) -> bool:
         """Check if RetroArch path is configured
@@ -303,8 +466,10 @@ class Config:
         Returns:
             True if initialized, False otherwise
         """
-        retroarch_path = self.config.get("retroarch_path", "")
-        return bool(retroarch_path and Path(retroarch_path).exists())
+        if self._initialized is None:
+            retroarch_path = self.config.get("retroarch_path", "")
+            self._initialized = bool(retroarch_path and Path(retroarch_path).exists())
+        return self._initialized
 
     def validate(self) -> List[str]:
         """Validate configuration
@@ -318,10 +483,39 @@ class Config:
             errors.append("RetroArch path not configured. Run 'init' command first.")
             return errors
 
-        # Check if paths exist
+        # Check if paths exist, listing each parent directory once. A listed
+        # entry answers from its cached type (a stat only for symlinks); names
+        # not listed, e.g. on case-insensitive filesystems, fall back to a stat.
+        entries_by_parent = {}
         for key in ["roms_path", "playlists_path", "thumbnails_path", "database_path"]:
             path = Path(self.config[key])
-            if not path.exists():
+            entries = entries_by_parent.get(path.parent)
+            if entries is None:
+                try:
+                    with os.scandir(path.parent) as it:
+                        entries = {entry.name: entry for entry in it}
+                except OSError:
+                    entries = {}
+                entries_by_parent[path.parent] = entries
+            entry = entries.get(path.name)
+            if entry is not None:
+                try:
+                    exists = entry.is_dir() or entry.is_file()
+                except OSError:
+                    exists = False
+            else:
+                exists = path.exists()
+            if not exists:
                 errors.append(f"{key} does not exist: {path}")
 
         return errors
+
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Get the shared Config instance, loaded once per process
+
+    Returns:
+        Config for the default config file location
+    """
+    return Config()
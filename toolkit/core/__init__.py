@@ -2,24 +2,37 @@
 RetroArch Toolkit Core Module
 """
 
-from .utils import calculate_crc32, normalize_rom_name, is_hack_version
-from .models import ROMInfo
-from .scanner import ROMScanner
-from .matcher import ROMMatcher
-from .playlist import PlaylistGenerator
-from .fetcher import BaseFetcher, FetchPlugin, FetchResult
-from .rdb_query import LibretroDBQuery
+import importlib
 
-__all__ = [
-    'calculate_crc32',
-    'normalize_rom_name',
-    'is_hack_version',
-    'ROMInfo',
-    'ROMScanner',
-    'ROMMatcher',
-    'PlaylistGenerator',
-    'BaseFetcher',
-    'FetchPlugin',
-    'FetchResult',
-    'LibretroDBQuery'
-]
+# Public names and the submodule defining them. Submodules are imported on
+# first access so that importing one of them (e.g. toolkit.core.utils) does
+# not load the whole package.
+_EXPORTS = {
+    'calculate_crc32': '.utils',
+    'normalize_rom_name': '.utils',
+    'is_hack_version': '.utils',
+    'ROMInfo': '.models',
+    'ROMScanner': '.scanner',
+    'ROMMatcher': '.matcher',
+    'PlaylistGenerator': '.playlist',
+    'BaseFetcher': '.fetcher',
+    'FetchPlugin': '.fetcher',
+    'FetchResult': '.fetcher',
+    'LibretroDBQuery': '.rdb_query',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    """Import the submodule exporting name on first access"""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -5,12 +5,35 @@ Maps ROM names to Chinese game names from CSV files
 
 import csv
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 
 class ChineseNameMapper:
     """Maps ROM names to Chinese game names"""
 
+    # Mapping of system names to CSV file names
+    SYSTEM_TO_CSV = {
+        "Nintendo - Game Boy": "Nintendo - Game Boy.csv",
+        "Nintendo - Game Boy Color": "Nintendo - Game Boy Color.csv",
+        "Nintendo - Game Boy Advance": "Nintendo - Game Boy Advance.csv",
+        "Nintendo - Nintendo Entertainment System": "Nintendo - Nintendo Entertainment System.csv",
+        "Nintendo - Super Nintendo Entertainment System": "Nintendo - Super Nintendo Entertainment System.csv",
+        "Nintendo - Nintendo 64": "Nintendo - Nintendo 64.csv",
+        "Nintendo - GameCube": "Nintendo - GameCube.csv",
+        "Nintendo - Wii": "Nintendo - Wii.csv",
+        "Nintendo - Nintendo DS": "Nintendo - Nintendo DS.csv",
+        "Nintendo - Nintendo 3DS": "Nintendo - Nintendo 3DS.csv",
+        "Sega - Master System - Mark III": "Sega - Master System.csv",
+        "Sega - Mega Drive - Genesis": "Sega - Mega Drive - Genesis.csv",
+        "Sega - Game Gear": "Sega - Game Gear.csv",
+        "Sega - Saturn": "Sega - Saturn.csv",
+        "Sega - Dreamcast": "Sega - Dreamcast.csv",
+        "Sony - PlayStation": "Sony - PlayStation.csv",
+        "Sony - PlayStation Portable": "Sony - PlayStation Portable.csv",
+        "SNK - Neo Geo": "Arcade - NEOGEO.csv",
+        "FBNeo - Arcade Games": "Arcade - NEOGEO.csv",
+    }
+
     def __init__(self, csv_dir: str = "deps/rom-name-cn"):
         """Initialize Chinese name mapper
 
@@ -19,41 +42,43 @@ class ChineseNameMapper:
         """
         self.csv_dir = Path(csv_dir)
         self.name_maps: Dict[str, Dict[str, str]] = {}
+        self._csv_paths: Dict[str, Path] = {}  # Systems whose CSV has not been parsed yet
+        self._lower_maps: Dict[str, Dict[str, str]] = {}  # Lowercase English name -> Chinese name
+        self._maps_by_path: Dict[Path, Tuple[Dict[str, str], Dict[str, str]]] = {}
         self._load_csv_files()
 
     def _load_csv_files(self):
-        """Load all CSV files from the directory"""
+        """Find the CSV file for each system; files are parsed on first use"""
         if not self.csv_dir.exists():
             print(f"Warning: Chinese name CSV directory not found: {self.csv_dir}")
             return
 
-        # Mapping of system names to CSV file names
-        system_to_csv = {
-            "Nintendo - Game Boy": "Nintendo - Game Boy.csv",
-            "Nintendo - Game Boy Color": "Nintendo - Game Boy Color.csv",
-            "Nintendo - Game Boy Advance": "Nintendo - Game Boy Advance.csv",
-            "Nintendo - Nintendo Entertainment System": "Nintendo - Nintendo Entertainment System.csv",
-            "Nintendo - Super Nintendo Entertainment System": "Nintendo - Super Nintendo Entertainment System.csv",
-            "Nintendo - Nintendo 64": "Nintendo - Nintendo 64.csv",
-            "Nintendo - GameCube": "Nintendo - GameCube.csv",
-            "Nintendo - Wii": "Nintendo - Wii.csv",
-            "Nintendo - Nintendo DS": "Nintendo - Nintendo DS.csv",
-            "Nintendo - Nintendo 3DS": "Nintendo - Nintendo 3DS.csv",
-            "Sega - Master System - Mark III": "Sega - Master System.csv",
-            "Sega - Mega Drive - Genesis": "Sega - Mega Drive - Genesis.csv",
-            "Sega - Game Gear": "Sega - Game Gear.csv",
-            "Sega - Saturn": "Sega - Saturn.csv",
-            "Sega - Dreamcast": "Sega - Dreamcast.csv",
-            "Sony - PlayStation": "Sony - PlayStation.csv",
-            "Sony - PlayStation Portable": "Sony - PlayStation Portable.csv",
-            "SNK - Neo Geo": "Arcade - NEOGEO.csv",
-            "FBNeo - Arcade Games": "Arcade - NEOGEO.csv",
-        }
-
-        for system_name, csv_filename in system_to_csv.items():
+        for system_name, csv_filename in self.SYSTEM_TO_CSV.items():
             csv_path = self.csv_dir / csv_filename
             if csv_path.exists():
-                self.name_maps[system_name] = self._load_csv(csv_path)
+                self._csv_paths[system_name] = csv_path
+
+    def _get_name_map(self, system: str) -> Optional[Dict[str, str]]:
+        """Get the name map for a system, parsing its CSV on first access
+
+        Args:
+            system: System name
+
+        Returns:
+            Dictionary mapping English name to Chinese name, or None if no CSV
+        """
+        if system not in self.name_maps and system in self._csv_paths:
+            csv_path = self._csv_paths.pop(system)
+            # Systems sharing a CSV (Neo Geo and FBNeo) reuse the parsed map
+            if csv_path not in self._maps_by_path:
+                name_map = self._load_csv(csv_path)
+                lower_map = {}
+                for en_name, cn_name in name_map.items():
+                    # Keep the first entry, as the old case-insensitive scan did
+                    lower_map.setdefault(en_name.lower(), cn_name)
+                self._maps_by_path[csv_path] = (name_map, lower_map)
+            self.name_maps[system], self._lower_maps[system] = self._maps_by_path[csv_path]
+        return self.name_maps.get(system)
 
     def _load_csv(self, csv_path: Path) -> Dict[str, str]:
         """Load a single CSV file
@@ -67,36 +92,47 @@ class ChineseNameMapper:
         name_map = {}
 
         try:
-            with open(csv_path, 'r', encoding='utf-8-sig') as f:
-                reader = csv.DictReader(f)
+            with open(csv_path, 'r', encoding='utf-8-sig', newline='') as f:
+                reader = csv.reader(f)
 
                 # Check CSV format
-                fieldnames = reader.fieldnames
-                if not fieldnames:
+                header = next(reader, None)
+                if not header:
                     return name_map
 
                 # Handle different CSV formats
-                if 'MAME Name' in fieldnames:
+                if 'MAME Name' in header:
                     # Format: MAME Name, EN Name, CN Name (for arcade games)
-                    for row in reader:
-                        mame_name = row.get('MAME Name', '').strip()
-                        en_name = row.get('EN Name', '').strip()
-                        cn_name = row.get('CN Name', '').strip()
-
-                        if en_name and cn_name:
-                            name_map[en_name] = cn_name
-                        if mame_name and cn_name:
-                            # Also map MAME name for arcade games
-                            name_map[mame_name] = cn_name
+                    i_mame = header.index('MAME Name')
+                    i_en = header.index('EN Name') if 'EN Name' in header else None
+                    i_cn = header.index('CN Name') if 'CN Name' in header else None
+                    if i_cn is None:
+                        return name_map
 
-                elif 'Name EN' in fieldnames and 'Name CN' in fieldnames:
-                    # Format: Name EN, Name CN
                     for row in reader:
-                        en_name = row.get('Name EN', '').strip()
-                        cn_name = row.get('Name CN', '').strip()
-
-                        if en_name and cn_name:
-                            name_map[en_name] = cn_name
+                        if len(row) <= i_cn:
+                            continue
+                        cn_name = row[i_cn].strip()
+                        if not cn_name:
+                            continue
+
+                        if i_en is not None and len(row) > i_en:
+                            en_name = row[i_en].strip()
+                            if en_name:
+                                name_map[en_name] = cn_name
+                        if len(row) > i_mame:
+                            mame_name = row[i_mame].strip()
+                            if mame_name:
+                                # Also map MAME name for arcade games
+                                name_map[mame_name] = cn_name
+
+                elif 'Name EN' in header and 'Name CN' in header:
+                    # Format: Name EN, Name CN
+                    i_en = header.index('Name EN')
+                    i_cn = header.index('Name CN')
+                    width = max(i_en, i_cn)
+                    pairs = ((row[i_en].strip(), row[i_cn].strip()) for row in reader if len(row) > width)
+                    name_map = {en_name: cn_name for en_name, cn_name in pairs if en_name and cn_name}
 
         except Exception as e:
             print(f"Warning: Error loading CSV {csv_path}: {e}")
@@ -113,22 +149,16 @@ class ChineseNameMapper:
         Returns:
             Chinese name if found, None otherwise
         """
-        if system not in self.name_maps:
+        name_map = self._get_name_map(system)
+        if name_map is None:
             return None
 
-        name_map = self.name_maps[system]
-
         # Try exact match first
         if en_name in name_map:
             return name_map[en_name]
 
         # Try case-insensitive match
-        en_name_lower = en_name.lower()
-        for key, value in name_map.items():
-            if key.lower() == en_name_lower:
-                return value
-
-        return None
+        return self._lower_maps[system].get(en_name.lower())
 
     def has_mapping_for_system(self, system: str) -> bool:
         """Check if Chinese name mapping exists for a system
@@ -139,4 +169,4 @@ class ChineseNameMapper:
         Returns:
             True if mapping exists
         """
-        return system in self.name_maps
+        return system in self.name_maps or system in self._csv_paths
@@ -0,0 +1,105 @@
+"""
+CRC Cache Module
+Persists ROM CRC32 checksums between scans
+"""
+
+import os
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+from .utils import load_json_file, save_json_file
+
+
+class CRCCache:
+    """On-disk CRC32 cache keyed by file path, size and modification time"""
+
+    def __init__(self, cache_path: str):
+        """Initialize CRC cache
+
+        Args:
+            cache_path: Path to cache JSON file
+        """
+        self.cache_path = Path(cache_path)
+        self.entries: Dict[str, Dict] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        """Load cache entries from disk"""
+        if not self.cache_path.exists():
+            return
+
+        try:
+            self.entries = load_json_file(self.cache_path)
+        except Exception as e:
+            print(f"Warning: Error loading CRC cache: {e}")
+            self.entries = {}
+
+    def get(self, path: str, size: int, mtime_ns: int) -> Optional[str]:
+        """Get cached CRC32 for a file
+
+        Args:
+            path: Absolute file path
+            size: File size in bytes
+            mtime_ns: File modification time in nanoseconds
+
+        Returns:
+            CRC32 hex string, or None if not cached or the file has changed
+        """
+        entry = self.entries.get(path)
+        if entry and entry.get('size') == size and entry.get('mtime_ns') == mtime_ns:
+            return entry.get('crc32')
+        return None
+
+    def put(self, path: str, size: int, mtime_ns: int, crc32: str):
+        """Store CRC32 for a file
+
+        Args:
+            path: Absolute file path
+            size: File size in bytes
+            mtime_ns: File modification time in nanoseconds
+            crc32: CRC32 hex string
+        """
+        self.entries[path] = {
+            'size': size,
+            'mtime_ns': mtime_ns,
+            'crc32': crc32
+        }
+        self._dirty = True
+
+    def prune(self, root: str, seen_paths: Iterable[str]):
+        """Drop entries under a scanned directory whose files were not found
+
+        Args:
+            root: Absolute path of the scanned directory
+            seen_paths: Absolute paths of the files found under root
+        """
+        prefix = os.path.join(root, '')
+        seen = set(seen_paths)
+        stale = [path for path in self.entries if path.startswith(prefix) and path not in seen]
+        for path in stale:
+            del self.entries[path]
+        if stale:
+            self._dirty = True
+
+    def save(self) -> bool:
+        """Save cache to disk if it has changed
+
+        Returns:
+            True if successful
+        """
+        if not self._dirty:
+            return True
+
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write a temporary file and swap it in, so an interrupted save
+            # never leaves a truncated cache behind
+            tmp_path = self.cache_path.with_suffix('.tmp')
+            save_json_file(tmp_path, self.entries, indent=False)
+            os.replace(tmp_path, self.cache_path)
+            self._dirty = False
+            return True
+        except Exception as e:
+            print(f"Warning: Error saving CRC cache: {e}")
+            return False
@@ -3,16 +3,201 @@ Base Fetcher Module
 Provides base class and plugin system for fetch modules
 """
 
-from abc import ABC, abstractmethod
-from dataclasses import dataclass, asdict
-from typing import Optional, List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Optional, List, Dict, Any, Iterator, Tuple
 from pathlib import Path
-import urllib.request
+import hashlib
+import http.client
+import importlib
+import os
+import random
+import sys
+import threading
 import urllib.error
+import urllib.parse
+import urllib.request
 import time
 
+from .utils import load_json_file, save_json_file
+
+# Units used by FetchPlugin._format_size, one per power of 1024
+SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+# Same User-Agent urlopen sends, so servers see no difference
+DEFAULT_USER_AGENT = f"Python-urllib/{sys.version_info[0]}.{sys.version_info[1]}"
+
+REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+
+# Longest wait between download retries, in seconds
+RETRY_MAX_DELAY = 30.0
+
+
+class _ConnectionPool:
+    """Keep-alive HTTP(S) connections shared by all threads, per host
+
+    A connection is checked out for the duration of one request and returned
+    once its response has been read completely, so later requests to the same
+    host skip the TCP and TLS handshakes.
+    """
+
+    def __init__(self, max_idle_per_host: int = 16):
+        self.max_idle_per_host = max_idle_per_host
+        self._idle: Dict[Tuple[str, str], List[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, scheme: str, host: str, timeout: float,
+                reuse: bool = True) -> Tuple[http.client.HTTPConnection, bool]:
+        """Check out a connection to host
+
+        Args:
+            scheme: 'http' or 'https'
+            host: Host and optional port
+            timeout: Socket timeout in seconds
+            reuse: Take an idle connection if there is one
+
+        Returns:
+            Tuple of (connection, True if it was an idle pooled connection)
+        """
+        if reuse:
+            with self._lock:
+                idle = self._idle.get((scheme, host))
+                if idle:
+                    conn = idle.pop()
+                    conn.timeout = timeout
+                    if conn.sock is not None:
+                        conn.sock.settimeout(timeout)
+                    return conn, True
+
+        if scheme == 'https':
+            return http.client.HTTPSConnection(host, timeout=timeout), False
+        return http.client.HTTPConnection(host, timeout=timeout), False
+
+    def release(self, scheme: str, host: str, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault((scheme, host), [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append(conn)
+                return
+        conn.close()
+
+
+_pool = _ConnectionPool()
 
-@dataclass
+
+def _needs_urlopen(parts: urllib.parse.SplitResult) -> bool:
+    """Check whether a URL must go through urlopen instead of the pool
+
+    The pool only speaks plain HTTP(S) to the host itself: other schemes,
+    URLs with credentials and hosts reached through a proxy (honouring
+    no_proxy) are left to urllib.
+
+    Args:
+        parts: Result of urllib.parse.urlsplit
+
+    Returns:
+        True if urlopen should handle the request
+    """
+    if parts.scheme not in ('http', 'https') or parts.username is not None:
+        return True
+    if not urllib.request.getproxies().get(parts.scheme):
+        return False
+    return not urllib.request.proxy_bypass(parts.hostname or '')
+
+
+@contextmanager
+def open_url(url: str, headers: Optional[Dict[str, str]] = None,
+             timeout: float = 30, max_redirects: int = 5) -> Iterator[http.client.HTTPResponse]:
+    """Open a URL for GET over a pooled keep-alive connection
+
+    Behaves like urllib.request.urlopen for the toolkit's needs: redirects are
+    followed and error statuses raise urllib.error.HTTPError. When a proxy is
+    configured in the environment, urlopen is used directly.
+
+    Args:
+        url: http or https URL
+        headers: Extra request headers
+        timeout: Socket timeout in seconds
+        max_redirects: Maximum number of redirects to follow
+
+    Yields:
+        Response object (supports read, readinto and headers)
+    """
+    request_headers = {'User-Agent': DEFAULT_USER_AGENT, 'Accept-Encoding': 'identity'}
+    if headers:
+        request_headers.update(headers)
+
+    parts = urllib.parse.urlsplit(url)
+    if _needs_urlopen(parts):
+        request = urllib.request.Request(url, headers=request_headers)
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            yield response
+        return
+
+    for _ in range(max_redirects + 1):
+        parts = urllib.parse.urlsplit(url)
+        if _needs_urlopen(parts):
+            # Redirected somewhere the pool does not handle
+            request = urllib.request.Request(url, headers=request_headers)
+            with urllib.request.urlopen(request, timeout=timeout) as response:
+                yield response
+            return
+
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+
+        conn, reused = _pool.acquire(parts.scheme, parts.netloc, timeout)
+        try:
+            conn.request('GET', path, headers=request_headers)
+            response = conn.getresponse()
+        except (http.client.HTTPException, ConnectionError):
+            conn.close()
+            if not reused:
+                raise
+            # The server closed an idle keep-alive connection; retry once on a new one
+            conn, _ = _pool.acquire(parts.scheme, parts.netloc, timeout, reuse=False)
+            try:
+                conn.request('GET', path, headers=request_headers)
+                response = conn.getresponse()
+            except BaseException:
+                conn.close()
+                raise
+        except BaseException:
+            conn.close()
+            raise
+
+        location = response.getheader('Location')
+        redirected = response.status in REDIRECT_STATUSES and location
+        try:
+            if redirected or response.status >= 400:
+                # Drain the body so the connection can be reused
+                response.read()
+            else:
+                yield response
+        except BaseException:
+            conn.close()
+            raise
+
+        # Reuse the connection only if the body was fully consumed
+        if response.isclosed() and not response.will_close:
+            _pool.release(parts.scheme, parts.netloc, conn)
+        else:
+            conn.close()
+
+        if redirected:
+            url = urllib.parse.urljoin(url, location)
+            continue
+        if response.status >= 400:
+            raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, None)
+        return
+
+    raise urllib.error.URLError(f"Too many redirects: {url}")
+
+
+@dataclass(**({"slots": True} if sys.version_info >= (3, 10) else {}))  # slots needs Python 3.10+
 class FetchResult:
     """Result from a fetch operation"""
     success: bool
@@ -22,11 +207,17 @@ class FetchResult:
     cached: bool = False
 
     def to_dict(self) -> Dict:
-        """Convert to dictionary"""
-        return asdict(self)
+        """Convert to dictionary (data is not copied)"""
+        return {
+            "success": self.success,
+            "data": self.data,
+            "error": self.error,
+            "source": self.source,
+            "cached": self.cached
+        }
 
 
-class FetchPlugin(ABC):
+class FetchPlugin:
     """Base class for fetch plugins
 
     All fetch plugins must inherit from this class and implement the required methods.
@@ -44,17 +235,21 @@ class FetchPlugin(ABC):
         self.cache_dir = cache_dir or Path.home() / ".cache" / "retroarch_toolkit"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.enabled = config.get("enabled", True)
+        self.timeout = config.get("timeout", 30)  # Socket timeout for downloads, in seconds
+        self.show_progress = True  # Print per-download progress (disable when downloading concurrently)
+        self._created_dirs = set()  # Directories already ensured by _ensure_dir
+        self._dir_listings: Dict[Path, set] = {}  # File names per directory, see _file_exists
+        self.not_found_urls = set()  # URLs that returned 404 (not requested again)
+        self.not_modified_urls = set()  # URLs whose conditional download returned 304
 
-    @abstractmethod
     def get_name(self) -> str:
         """Get plugin name
 
         Returns:
             Plugin name
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def search_game(self, query: str, system: Optional[str] = None, **kwargs) -> FetchResult:
         """Search for a game
 
@@ -66,9 +261,8 @@ class FetchPlugin(ABC):
         Returns:
             FetchResult with search results
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def get_game_info(self, game_id: str, **kwargs) -> FetchResult:
         """Get detailed game information
 
@@ -79,95 +273,282 @@ class FetchPlugin(ABC):
         Returns:
             FetchResult with game information
         """
-        pass
+        raise NotImplementedError
 
     def download_file(self, url: str, output_path: Path, retry: int = 3,
-                     show_progress: bool = True) -> bool:
+                     show_progress: Optional[bool] = None, conditional: bool = False) -> bool:
         """Download a file from URL with progress display
 
         Args:
             url: URL to download
             output_path: Where to save the file
             retry: Number of retry attempts
-            show_progress: Show download progress
+            show_progress: Show download progress (defaults to self.show_progress)
+            conditional: Keep the response's ETag/Last-Modified under cache_dir and,
+                when output_path already exists, only download it if it changed
+                on the server (a 304 keeps the existing file and adds url to
+                not_modified_urls)
 
         Returns:
-            True if successful
+            True if successful (including not modified)
         """
+        if show_progress is None:
+            show_progress = self.show_progress
+
+        # Known missing file, skip the round-trip
+        if url in self.not_found_urls:
+            return False
+
         # Spinner animation frames
         spinner_frames = ['⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏']
 
+        # Data is streamed here and moved to output_path once complete
+        part_path = output_path.with_name(output_path.name + '.part')
+
+        validators_path = self._validators_path(output_path)
+        headers = self._conditional_headers(output_path, validators_path) if conditional else None
+
+        # Bytes already in part_path from a failed attempt, resumed with a Range request
+        resume_from = 0
+        if_range = None  # Validator of the partial content, so a changed file is sent whole
+
         for attempt in range(retry):
+            error = None
             try:
                 # Create parent directory if needed
-                output_path.parent.mkdir(parents=True, exist_ok=True)
+                self._ensure_dir(output_path.parent)
+
+                request_headers = headers
+                if resume_from:
+                    request_headers = {'Range': f'bytes={resume_from}-'}
+                    if if_range:
+                        request_headers['If-Range'] = if_range
 
                 # Download file with progress
-                with urllib.request.urlopen(url, timeout=30) as response:
+                with open_url(url, headers=request_headers, timeout=self.timeout) as response:
+                    if response.status == 304:
+                        response.read()
+                        self._mark_not_modified(url, output_path, show_progress)
+                        return True
+
+                    # A 200 means the server ignored the range, so start over
+                    resumed = resume_from > 0 and response.status == 206
+                    if resumed:
+                        # Only append a range that starts where the partial file ends
+                        unit, _, byte_range = response.headers.get('Content-Range', '').partition(' ')
+                        if unit != 'bytes' or byte_range.split('-', 1)[0] != str(resume_from):
+                            if show_progress:
+                                print("\r  ✗ Unexpected range, restarting download", flush=True)
+                            resume_from = 0
+                            if_range = None
+                            continue
+                    else:
+                        etag = response.headers.get('ETag')
+                        if_range = etag if etag and not etag.startswith('W/') else response.headers.get('Last-Modified')
+
                     # Get file size from headers
                     file_size = response.headers.get('Content-Length')
                     if file_size:
-                        file_size = int(file_size)
+                        file_size = int(file_size) + (resume_from if resumed else 0)
                     else:
                         file_size = None
 
-                    # Read data in chunks
-                    chunk_size = 8192
-                    downloaded = 0
-                    data_chunks = []
+                    # Stream chunks straight to a partial file, moved into place when complete
+                    chunk_size = 131072
+                    downloaded = resume_from if resumed else 0
                     spinner_idx = 0
-
-                    while True:
-                        chunk = response.read(chunk_size)
-                        if not chunk:
-                            break
-                        data_chunks.append(chunk)
-                        downloaded += len(chunk)
-
-                        # Update progress with spinner
-                        if show_progress:
-                            if file_size:
-                                progress = (downloaded / file_size) * 100
-                                spinner = spinner_frames[spinner_idx % len(spinner_frames)]
-                                print(f"\r  {spinner} ({progress:5.1f}%) {self._format_size(downloaded)}/{self._format_size(file_size)}",
-                                      end='', flush=True)
-                            else:
-                                spinner = spinner_frames[spinner_idx % len(spinner_frames)]
-                                print(f"\r  {spinner} Downloading... {self._format_size(downloaded)}",
-                                      end='', flush=True)
-                            spinner_idx += 1
-
-                    # Save to file
-                    with open(output_path, 'wb') as f:
-                        for chunk in data_chunks:
-                            f.write(chunk)
+                    last_update = 0.0
+                    total_str = self._format_size(file_size) if file_size else None
+
+                    # Read into one reusable buffer instead of allocating a bytes object
+                    # per chunk; a 1 MiB write buffer batches the chunks into fewer write() calls
+                    buffer = memoryview(bytearray(chunk_size))
+                    with open(part_path, 'ab' if resumed else 'wb', buffering=1 << 20) as f:
+                        while True:
+                            n = response.readinto(buffer)
+                            if not n:
+                                break
+                            f.write(buffer[:n])
+                            downloaded += n
+
+                            # Update progress with spinner, at most every 0.1s so
+                            # terminal writes don't dominate fast downloads
+                            if show_progress:
+                                now = time.monotonic()
+                                if now - last_update >= 0.1:
+                                    last_update = now
+                                    spinner = spinner_frames[spinner_idx % len(spinner_frames)]
+                                    if total_str:
+                                        progress = (downloaded / file_size) * 100
+                                        line = f"\r  {spinner} ({progress:5.1f}%) {self._format_size(downloaded)}/{total_str}"
+                                    else:
+                                        line = f"\r  {spinner} Downloading... {self._format_size(downloaded)}"
+                                    sys.stdout.write(line)
+                                    sys.stdout.flush()
+                                    spinner_idx += 1
+
+                    os.replace(part_path, output_path)
+                    listing = self._dir_listings.get(output_path.parent)
+                    if listing is not None:
+                        listing.add(output_path.name)
+                    if conditional:
+                        self._save_validators(validators_path, response.headers, downloaded)
 
                     # Show completion
-                    final_size = output_path.stat().st_size
                     if show_progress:
-                        print(f"\r  ✓ (100.0%) {self._format_size(final_size)}/{self._format_size(final_size)}", flush=True)
+                        print(f"\r  ✓ (100.0%) {self._format_size(downloaded)}/{self._format_size(downloaded)}", flush=True)
 
                 return True
 
             except urllib.error.HTTPError as e:
+                error = e
+                if e.code == 304:
+                    # urlopen (used behind a proxy) reports 304 as an error
+                    self._mark_not_modified(url, output_path, show_progress)
+                    return True
+                if e.code == 416:
+                    # The partial file doesn't fit the current content, retry from scratch
+                    resume_from = 0
                 if e.code == 404:
                     # File not found, no need to retry
+                    self.not_found_urls.add(url)
                     if show_progress:
-                        print(f"\r  ✗ File not found (404)", flush=True)
-                    return False
+                        print("\r  ✗ File not found (404)", flush=True)
+                    break
                 if show_progress:
                     print(f"\r  ✗ HTTP Error {e.code}", flush=True)
             except Exception as e:
                 if show_progress:
                     print(f"\r  ✗ Error: {str(e)[:50]}", flush=True)
+                # Resume from whatever reached the disk, if the server could tell us
+                # whether the content changed in between
+                try:
+                    resume_from = part_path.stat().st_size if if_range else 0
+                except OSError:
+                    resume_from = 0
 
             if attempt < retry - 1:
                 if show_progress:
                     print(f"  Retrying... (attempt {attempt + 2}/{retry})")
-                time.sleep(1)  # Wait before retry
+                time.sleep(self._retry_delay(attempt, error))
 
+        # Don't leave a truncated download behind
+        try:
+            part_path.unlink()
+        except OSError:
+            pass
         return False
 
+    def _validators_path(self, output_path: Path) -> Path:
+        """Get where the cache validators of a download are stored
+
+        Validators live under cache_dir rather than next to the file, so
+        output directories (such as the user's database folder) only hold
+        the downloads themselves.
+
+        Args:
+            output_path: Downloaded file
+
+        Returns:
+            JSON file path, named after a hash of the absolute output path
+        """
+        key = hashlib.blake2b(str(output_path.absolute()).encode('utf-8'), digest_size=16).hexdigest()
+        return self.cache_dir / "validators" / f"{key}.json"
+
+    def _conditional_headers(self, output_path: Path, validators_path: Path) -> Optional[Dict[str, str]]:
+        """Build If-None-Match/If-Modified-Since headers for an existing download
+
+        Args:
+            output_path: Previously downloaded file
+            validators_path: File written by _save_validators
+
+        Returns:
+            Request headers, or None if the file or its validators are missing
+        """
+        try:
+            size = output_path.stat().st_size
+            meta = load_json_file(validators_path)
+        except (OSError, ValueError):
+            return None
+
+        # The file was replaced or truncated since it was downloaded
+        if meta.get('size') != size:
+            return None
+
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        return headers or None
+
+    def _save_validators(self, validators_path: Path, response_headers, size: int) -> None:
+        """Store a response's cache validators for a downloaded file
+
+        Args:
+            validators_path: Result of _validators_path
+            response_headers: Response headers
+            size: Downloaded size in bytes
+        """
+        meta = {
+            'etag': response_headers.get('ETag'),
+            'last_modified': response_headers.get('Last-Modified'),
+            'size': size
+        }
+        try:
+            if meta['etag'] or meta['last_modified']:
+                self._ensure_dir(validators_path.parent)
+                save_json_file(validators_path, meta, indent=False)
+            elif validators_path.exists():
+                validators_path.unlink()
+        except OSError:
+            pass  # Validators are an optimisation only
+
+    def _mark_not_modified(self, url: str, output_path: Path, show_progress: bool) -> None:
+        """Record that the server reported the existing download as unchanged
+
+        Args:
+            url: Requested URL
+            output_path: Existing file, whose mtime is refreshed
+            show_progress: Print a status line
+        """
+        self.not_modified_urls.add(url)
+        try:
+            os.utime(output_path)
+        except OSError:
+            pass
+        if show_progress:
+            print("\r  ✓ Not modified", flush=True)
+
+    @staticmethod
+    def _retry_delay(attempt: int, error: Optional[Exception] = None) -> float:
+        """Get the wait before retrying a failed download
+
+        Backs off exponentially with random jitter so concurrent downloads don't
+        retry in lockstep, and honors Retry-After on 429/503 responses.
+
+        Args:
+            attempt: Zero-based number of the attempt that failed
+            error: Error that made the attempt fail, if any
+
+        Returns:
+            Delay in seconds
+        """
+        if isinstance(error, urllib.error.HTTPError) and error.code in (429, 503) and error.headers:
+            retry_after = error.headers.get('Retry-After')
+            if retry_after:
+                try:
+                    delay = float(retry_after)
+                except ValueError:
+                    try:
+                        delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+                    except (TypeError, ValueError):
+                        delay = None
+                if delay is not None:
+                    return min(RETRY_MAX_DELAY, max(0.0, delay))
+
+        return min(RETRY_MAX_DELAY, 0.5 * (2 ** attempt) + random.random() * 0.5)
+
     def _format_size(self, size_bytes: int) -> str:
         """Format file size in human-readable format
 
@@ -177,11 +558,55 @@ class FetchPlugin(ABC):
         Returns:
             Formatted string (e.g., '1.5 MB')
         """
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.2f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.2f} TB"
+        # Pick the unit directly from the bit length (every 10 bits is one 1024 step)
+        unit_idx = min((int(size_bytes).bit_length() - 1) // 10, len(SIZE_UNITS) - 1) if size_bytes >= 1 else 0
+        return f"{size_bytes / (1 << (unit_idx * 10)):.2f} {SIZE_UNITS[unit_idx]}"
+
+    def _ensure_dir(self, path: Path) -> Path:
+        """Create a directory once, skipping the mkdir syscall on later calls
+
+        Args:
+            path: Directory path
+
+        Returns:
+            The same path
+        """
+        if path not in self._created_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(path)
+        return path
+
+    def _file_exists(self, path: Path) -> bool:
+        """Check whether a file exists using a cached listing of its directory
+
+        Meant for pre-checks over many names in one directory, such as the
+        thumbnail cache check. The first check in a directory lists it once
+        with os.scandir, so later misses are set lookups instead of a stat()
+        each. A hit is confirmed with a stat, since the file may have been
+        removed since the listing was taken; a file created by something
+        other than download_file is only seen after the plugin is recreated,
+        which at worst costs a repeated download.
+
+        Args:
+            path: File path
+
+        Returns:
+            True if the file exists
+        """
+        listing = self._dir_listings.get(path.parent)
+        if listing is None:
+            try:
+                with os.scandir(path.parent) as it:
+                    listing = {entry.name for entry in it}
+            except OSError:
+                listing = set()
+            self._dir_listings[path.parent] = listing
+        if path.name not in listing:
+            return False
+        if path.exists():
+            return True
+        listing.discard(path.name)
+        return False
 
     def get_cached_file(self, cache_key: str) -> Optional[Path]:
         """Get cached file if it exists
@@ -209,6 +634,14 @@ class FetchPlugin(ABC):
 class BaseFetcher:
     """Base fetcher class that manages multiple fetch plugins"""
 
+    # Built-in plugins: name -> (module relative to this package, class name).
+    # Plugins are imported and initialized the first time they are needed.
+    PLUGIN_REGISTRY = {
+        "retroarch_db": ("..plugins.retroarch_db", "RetroArchDBFetcher"),
+        "libretro_thumbnails": ("..plugins.libretro_thumbnails", "LibretroThumbnailsFetcher"),
+        "launchbox": ("..plugins.launchbox", "LaunchBoxFetcher"),
+    }
+
     def __init__(self, config):
         """Initialize fetcher
 
@@ -217,37 +650,48 @@ class BaseFetcher:
         """
         self.config = config
         self.plugins: Dict[str, FetchPlugin] = {}
+        self._pending: Dict[str, Dict] = {}  # Enabled built-in plugins not loaded yet, with their config
         self._load_plugins()
 
     def _load_plugins(self):
-        """Load and initialize fetch plugins"""
-        # Import plugin classes
-        from ..plugins.retroarch_db import RetroArchDBFetcher
-        from ..plugins.libretro_thumbnails import LibretroThumbnailsFetcher
-        from ..plugins.launchbox import LaunchBoxFetcher
-
-        # Initialize plugins
-        plugin_classes = [
-            RetroArchDBFetcher,
-            LibretroThumbnailsFetcher,
-            LaunchBoxFetcher
-        ]
-
-        for plugin_class in plugin_classes:
-            try:
-                # Get plugin config
-                plugin_name = plugin_class.PLUGIN_NAME
-                plugin_config = self.config.get(f"fetch_sources.{plugin_name}", {})
+        """Find enabled plugins; each one is loaded by _load_plugin on first use"""
+        for plugin_name in self.PLUGIN_REGISTRY:
+            plugin_config = self.config.get(f"fetch_sources.{plugin_name}", {})
+            if plugin_config.get("enabled", True):
+                self._pending[plugin_name] = plugin_config
 
-                # Initialize plugin
-                plugin = plugin_class(plugin_config)
+    def _load_plugin(self, plugin_name: str) -> Optional[FetchPlugin]:
+        """Import and initialize a built-in plugin
 
-                if plugin.is_enabled():
-                    self.plugins[plugin_name] = plugin
-                    print(f"Loaded fetch plugin: {plugin_name}")
+        Args:
+            plugin_name: Plugin name
 
-            except Exception as e:
-                print(f"Error loading plugin {plugin_class.__name__}: {e}")
+        Returns:
+            Plugin instance or None if it failed to load
+        """
+        plugin_config = self._pending.pop(plugin_name)
+        module_name, class_name = self.PLUGIN_REGISTRY[plugin_name]
+
+        try:
+            plugin_class = getattr(importlib.import_module(module_name, __package__), class_name)
+
+            # Initialize plugin with its config
+            plugin = plugin_class(plugin_config)
+
+            if plugin.is_enabled():
+                self.plugins[plugin_name] = plugin
+                print(f"Loaded fetch plugin: {plugin_name}")
+                return plugin
+
+        except Exception as e:
+            print(f"Error loading plugin {class_name}: {e}")
+
+        return None
+
+    def _load_all_plugins(self):
+        """Load every enabled plugin that has not been loaded yet"""
+        for plugin_name in list(self._pending):
+            self._load_plugin(plugin_name)
 
     def get_plugin(self, plugin_name: str) -> Optional[FetchPlugin]:
         """Get a specific plugin
@@ -258,33 +702,94 @@ class BaseFetcher:
         Returns:
             Plugin instance or None
         """
-        return self.plugins.get(plugin_name)
+        if plugin_name in self.plugins:
+            return self.plugins[plugin_name]
+        if plugin_name in self._pending:
+            return self._load_plugin(plugin_name)
+        return None
 
-    def search_all(self, query: str, system: Optional[str] = None) -> Dict[str, FetchResult]:
-        """Search across all enabled plugins
+    def _call_all(self, method_name: str, *args) -> Dict[str, FetchResult]:
+        """Call a method on every enabled plugin concurrently
+
+        Plugins are independent and I/O-bound, so the total time is that of
+        the slowest plugin rather than the sum.
 
         Args:
-            query: Search query
-            system: Optional system filter
+            method_name: FetchPlugin method to call
+            *args: Arguments passed to the method
 
         Returns:
-            Dictionary mapping plugin name to FetchResult
+            Dictionary mapping plugin name to FetchResult, in plugin order
         """
-        results = {}
+        self._load_all_plugins()
+        if not self.plugins:
+            return {}
 
-        for plugin_name, plugin in self.plugins.items():
+        def call(item) -> FetchResult:
+            plugin_name, plugin = item
             try:
-                result = plugin.search_game(query, system)
-                results[plugin_name] = result
+                return getattr(plugin, method_name)(*args)
             except Exception as e:
-                results[plugin_name] = FetchResult(
+                return FetchResult(
                     success=False,
                     error=str(e),
                     source=plugin_name
                 )
 
+        items = list(self.plugins.items())
+        with ThreadPoolExecutor(max_workers=len(items)) as executor:
+            return dict(zip((name for name, _ in items), executor.map(call, items)))
+
+    async def _call_all_async(self, method_name: str, *args) -> Dict[str, FetchResult]:
+        """Call a method on every enabled plugin concurrently from an event loop
+
+        A plugin may provide a native coroutine named <method_name>_async;
+        otherwise its blocking method runs in the loop's default executor.
+
+        Args:
+            method_name: FetchPlugin method to call
+            *args: Arguments passed to the method
+
+        Returns:
+            Dictionary mapping plugin name to FetchResult, in plugin order
+        """
+        import asyncio  # Only needed by the async API, keep it off other commands
+
+        self._load_all_plugins()
+        loop = asyncio.get_running_loop()
+
+        def call(plugin: FetchPlugin):
+            method = getattr(plugin, f"{method_name}_async", None)
+            if method is not None:
+                return method(*args)
+            return loop.run_in_executor(None, getattr(plugin, method_name), *args)
+
+        items = list(self.plugins.items())
+        outcomes = await asyncio.gather(*(call(plugin) for _, plugin in items), return_exceptions=True)
+
+        results = {}
+        for (plugin_name, _), outcome in zip(items, outcomes):
+            if isinstance(outcome, Exception):
+                outcome = FetchResult(
+                    success=False,
+                    error=str(outcome),
+                    source=plugin_name
+                )
+            results[plugin_name] = outcome
         return results
 
+    def search_all(self, query: str, system: Optional[str] = None) -> Dict[str, FetchResult]:
+        """Search across all enabled plugins
+
+        Args:
+            query: Search query
+            system: Optional system filter
+
+        Returns:
+            Dictionary mapping plugin name to FetchResult
+        """
+        return self._call_all("search_game", query, system)
+
     def get_game_info_all(self, game_id: str) -> Dict[str, FetchResult]:
         """Get game info from all enabled plugins
 
@@ -294,20 +799,30 @@ class BaseFetcher:
         Returns:
             Dictionary mapping plugin name to FetchResult
         """
-        results = {}
+        return self._call_all("get_game_info", game_id)
 
-        for plugin_name, plugin in self.plugins.items():
-            try:
-                result = plugin.get_game_info(game_id)
-                results[plugin_name] = result
-            except Exception as e:
-                results[plugin_name] = FetchResult(
-                    success=False,
-                    error=str(e),
-                    source=plugin_name
-                )
+    async def search_all_async(self, query: str, system: Optional[str] = None) -> Dict[str, FetchResult]:
+        """Search across all enabled plugins without blocking the event loop
 
-        return results
+        Args:
+            query: Search query
+            system: Optional system filter
+
+        Returns:
+            Dictionary mapping plugin name to FetchResult
+        """
+        return await self._call_all_async("search_game", query, system)
+
+    async def get_game_info_all_async(self, game_id: str) -> Dict[str, FetchResult]:
+        """Get game info from all enabled plugins without blocking the event loop
+
+        Args:
+            game_id: Game identifier
+
+        Returns:
+            Dictionary mapping plugin name to FetchResult
+        """
+        return await self._call_all_async("get_game_info", game_id)
 
     def list_plugins(self) -> List[str]:
         """Get list of loaded plugin names
@@ -315,7 +830,7 @@ class BaseFetcher:
         Returns:
             List of plugin names
         """
-        return list(self.plugins.keys())
+        return list(self.plugins.keys()) + [name for name in self._pending if name not in self.plugins]
 
     def register_plugin(self, plugin: FetchPlugin) -> bool:
         """Register a custom plugin
@@ -329,6 +844,7 @@ class BaseFetcher:
         try:
             plugin_name = plugin.get_name()
             self.plugins[plugin_name] = plugin
+            self._pending.pop(plugin_name, None)
             print(f"Registered custom plugin: {plugin_name}")
             return True
         except Exception as e:
@@ -5,11 +5,13 @@ Interactive shell for matching unmatched ROMs using prompt_toolkit
 
 import os
 import sys
-import io
 import time
+import bisect
+import shutil
 import re
+import unicodedata
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 from prompt_toolkit import PromptSession
 from prompt_toolkit.completion import WordCompleter
 from prompt_toolkit.formatted_text import HTML
@@ -17,12 +19,39 @@ from prompt_toolkit.styles import Style
 
 from .models import ROMInfo
 from .matcher import ROMMatcher
-from .utils import rename_rom
+from .utils import load_json_file, rename_rom, save_json_file
+
+
+def _display_width(text: str) -> int:
+    """Get the number of terminal columns text occupies
+
+    Wide and fullwidth characters (e.g. CJK) take two columns.
+
+    Args:
+        text: Text without control sequences
+
+    Returns:
+        Width in columns
+    """
+    return sum(2 if unicodedata.east_asian_width(char) in ('W', 'F') else 1 for char in text)
+
+
+# Characters dropped from game names when building LaunchBox detail URLs
+_URL_CLEAN_RE = re.compile(r'[^a-z0-9-]')
 
 
 class InteractiveMatcher:
     """Interactive shell for matching unmatched ROMs"""
 
+    # Maximum number of similar-game results kept, in memory and on disk
+    SIMILAR_CACHE_SIZE = 10000
+
+    # Similar-game cache file, stored next to manual_matches.json
+    SIMILAR_CACHE_FILE = "similar_games_cache.json"
+
+    # Local search stops scanning a database after this many matches
+    MAX_SEARCH_RESULTS = 50
+
     def __init__(self, config, matcher: ROMMatcher, unknown_games: Dict, manual_matches_path: Path, auto_rename: bool = False):
         """Initialize interactive matcher
 
@@ -40,10 +69,32 @@ class InteractiveMatcher:
         self.auto_rename = auto_rename
         self.current_index = 0
         self.games_list = list(unknown_games.items())
+        # Menu label for each ROM, indexed like games_list
+        self._display_cache = [
+            "{} ({})".format(rom_info['filename'], rom_info['system'])
+            for _, rom_info in self.games_list
+        ]
         self.fixed_count = 0
         self.skipped_count = 0
         self.renamed_count = 0
-        self._processed_roms = set()  # Track processed ROM indices
+        # One byte per ROM, set to 1 once processed
+        self._processed_mask = bytearray(len(self.games_list))
+        self._processed_count = 0
+        # Unprocessed ROM indices in display order, kept in step with _processed_mask
+        self._remaining_indices = list(range(len(self.games_list)))
+        # (crc32 or filename, system) -> similar games, least recently used first
+        self._similar_cache = {}
+        self._similar_cache_dirty = False
+        self.similar_cache_path = manual_matches_path.parent / self.SIMILAR_CACHE_FILE
+        # LaunchBox fetcher, created on the first online search
+        self._launchbox = None
+        # Status messages shown at the top of the next full screen, so that
+        # results do not need a blocking pause to be seen
+        self._toasts = []
+        # Lines of the ROM menu currently on screen, None once anything else is drawn
+        self._menu_lines = None
+        # Whether a notice from _flash_message is shown below the menu
+        self._notice_shown = False
 
         # Create prompt session
         self.session = PromptSession()
@@ -71,10 +122,30 @@ class InteractiveMatcher:
 
     def _clear_screen(self):
         """Clear the terminal screen"""
+        self._menu_lines = None
+        self._notice_shown = False
         sys.stdout.write('\033[2J')      # Clear screen
         sys.stdout.write('\033[H')        # Move cursor to top-left
         sys.stdout.flush()
 
+    def _render_frame(self, lines: List[str], clear: bool = False):
+        """Write a block of lines to the terminal in a single write
+
+        Args:
+            lines: Lines to show (without trailing newlines)
+            clear: Clear the screen before drawing
+        """
+        self._menu_lines = None
+        self._notice_shown = False
+        if clear and self._toasts:
+            lines = self._toasts + [""] + lines
+            self._toasts = []
+        frame = "\n".join(lines) + "\n"
+        if clear:
+            frame = '\033[2J\033[H' + frame
+        sys.stdout.write(frame)
+        sys.stdout.flush()
+
     def _clear_lines(self, n: int):
         """Clear n lines up from current position"""
         for _ in range(n):
@@ -86,6 +157,8 @@ class InteractiveMatcher:
         Returns:
             Exit code (0 for success)
         """
+        self._load_similar_cache()
+
         # Enter alternate screen buffer (like vim/less)
         self._enter_alternate_screen()
 
@@ -105,9 +178,15 @@ class InteractiveMatcher:
                     break
 
                 # Process selected ROMs
+                fixed_before, skipped_before = self.fixed_count, self.skipped_count
                 for idx in selected_indices:
                     self._process_single_rom(idx)
 
+                if len(selected_indices) > 1:
+                    self._toasts.append("Batch done: {} fixed, {} skipped".format(
+                        self.fixed_count - fixed_before, self.skipped_count - skipped_before
+                    ))
+
             # Print summary
             self._print_summary()
             input("Press Enter to exit...")
@@ -116,6 +195,32 @@ class InteractiveMatcher:
         finally:
             # Always exit alternate screen buffer to restore original screen
             self._exit_alternate_screen()
+            self._save_similar_cache()
+
+    def _mark_processed(self, rom_index: int):
+        """Mark a ROM as processed and drop it from the selection menu
+
+        Args:
+            rom_index: Index in self.games_list
+        """
+        if self._processed_mask[rom_index]:
+            return
+        self._processed_mask[rom_index] = 1
+        self._processed_count += 1
+        position = bisect.bisect_left(self._remaining_indices, rom_index)
+        del self._remaining_indices[position]
+
+    def _unmark_processed(self, rom_index: int):
+        """Return a ROM to the selection menu at its original position
+
+        Args:
+            rom_index: Index in self.games_list
+        """
+        if not self._processed_mask[rom_index]:
+            return
+        self._processed_mask[rom_index] = 0
+        self._processed_count -= 1
+        bisect.insort(self._remaining_indices, rom_index)
 
     def _show_rom_selection_menu(self) -> list:
         """Show ROM selection menu with pagination (10 per page)
@@ -125,58 +230,28 @@ class InteractiveMatcher:
         """
         page = 0
         items_per_page = 10
+        needs_redraw = True
 
         while True:
-            # Clear screen for clean display
-            self._clear_screen()
-
-            print("=" * 60)
-            print("Interactive ROM Matcher")
-            print("=" * 60)
-            print("Total unmatched: {} | Fixed: {} | Skipped: {}".format(
-                len(self.games_list), self.fixed_count, self.skipped_count
-            ))
-            print("=" * 60)
-
             # Calculate pagination
             start_idx = page * items_per_page
             end_idx = min(start_idx + items_per_page, len(self.games_list))
 
-            # Filter out already processed ROMs
-            remaining_games = []
-
-            for i in range(len(self.games_list)):
-                if i not in self._processed_roms:
-                    remaining_games.append(i)
+            # Already processed ROMs are removed as they are processed
+            remaining_games = self._remaining_indices
 
             if not remaining_games:
-                print("All ROMs have been processed!")
+                self._render_frame(["All ROMs have been processed!"], clear=True)
                 input("Press Enter to continue...")
                 return []
 
             # Get current page items
             page_items = remaining_games[start_idx:end_idx]
 
-            # Display ROMs on current page
-            print("Page {}/{}:".format(
-                page + 1,
-                (len(remaining_games) + items_per_page - 1) // items_per_page
-            ))
-            print()
-
-            for i, rom_idx in enumerate(page_items, 1):
-                _, rom_info = self.games_list[rom_idx]
-                print("  {}. {} ({})".format(i, rom_info['filename'], rom_info['system']))
-
-            print()
-            print("=" * 60)
-            print("Commands:")
-            print("  1-10     - Select ROM to match")
-            print("  a/all    - Match all on this page")
-            print("  n/next   - Next page")
-            print("  p/prev   - Previous page")
-            print("  q/quit   - Quit")
-            print("=" * 60)
+            # Only repaint the menu when the page or its contents changed
+            if needs_redraw:
+                self._render_rom_menu(page, items_per_page, page_items, len(remaining_games))
+                needs_redraw = False
 
             choice = self.session.prompt(
                 HTML('<prompt>Choice: </prompt>'),
@@ -188,15 +263,15 @@ class InteractiveMatcher:
             elif choice in ['n', 'next']:
                 if end_idx < len(remaining_games):
                     page += 1
+                    needs_redraw = True
                 else:
-                    print("Already at last page")
-                    time.sleep(0.5)
+                    self._flash_message("Already at last page")
             elif choice in ['p', 'prev']:
                 if page > 0:
                     page -= 1
+                    needs_redraw = True
                 else:
-                    print("Already at first page")
-                    time.sleep(0.5)
+                    self._flash_message("Already at first page")
             elif choice in ['a', 'all']:
                 return page_items
             else:
@@ -206,11 +281,89 @@ class InteractiveMatcher:
                     if 1 <= idx <= len(page_items):
                         return [page_items[idx - 1]]
                     else:
-                        print("Invalid choice. Try 1-{}".format(len(page_items)))
-                        time.sleep(0.5)
+                        self._flash_message("Invalid choice. Try 1-{}".format(len(page_items)))
                 except ValueError:
-                    print("Invalid choice")
-                    time.sleep(0.5)
+                    self._flash_message("Invalid choice")
+
+    def _render_rom_menu(self, page: int, items_per_page: int, page_items: list, remaining_count: int):
+        """Clear the screen and draw the ROM selection menu
+
+        Args:
+            page: Current page number (0-based)
+            items_per_page: Number of ROMs per page
+            page_items: ROM indices shown on this page
+            remaining_count: Number of ROMs not yet processed
+        """
+        lines = [
+            "=" * 60,
+            "Interactive ROM Matcher",
+            "=" * 60,
+            "Total unmatched: {} | Fixed: {} | Skipped: {}".format(
+                len(self.games_list), self.fixed_count, self.skipped_count
+            ),
+            "=" * 60,
+            # Display ROMs on current page
+            "Page {}/{}:".format(
+                page + 1,
+                (remaining_count + items_per_page - 1) // items_per_page
+            ),
+            "",
+        ]
+
+        display_cache = self._display_cache
+        lines += ["  {}. {}".format(i, display_cache[rom_idx]) for i, rom_idx in enumerate(page_items, 1)]
+
+        lines += [
+            "",
+            "=" * 60,
+            "Commands:",
+            "  1-10     - Select ROM to match",
+            "  a/all    - Match all on this page",
+            "  n/next   - Next page",
+            "  p/prev   - Previous page",
+            "  q/quit   - Quit",
+            "=" * 60,
+        ]
+
+        previous = self._menu_lines
+        terminal_size = shutil.get_terminal_size()
+        # Rows can only be addressed absolutely while the whole menu and the
+        # prompt fit on screen without scrolling and no line wraps
+        fits = (terminal_size.lines > len(lines) + 1
+                and all(_display_width(line) < terminal_size.columns for line in lines))
+        if previous is not None and not self._toasts and fits and len(previous) == len(lines):
+            # Same layout still on screen: overwrite only the rows that changed,
+            # then erase the answered prompt below the menu
+            parts = [
+                '\033[{};1H\033[2K{}'.format(row, line)
+                for row, (old, line) in enumerate(zip(previous, lines), 1)
+                if old != line
+            ]
+            parts.append('\033[{};1H\033[J'.format(len(lines) + 1))
+            sys.stdout.write(''.join(parts))
+            sys.stdout.flush()
+            self._menu_lines = lines
+            self._notice_shown = False
+        else:
+            # Toasts drawn above the menu shift its rows, so only a plain frame
+            # that fits the screen can be diffed against later
+            diffable = fits and not self._toasts
+            # Clear screen and draw in one write for clean display
+            self._render_frame(lines, clear=True)
+            self._menu_lines = lines if diffable else None
+
+    def _flash_message(self, message: str):
+        """Show a notice below the menu without redrawing it
+
+        The notice replaces the answered prompt (and any previous notice) and
+        stays until the menu is redrawn, so the next prompt appears below it.
+
+        Args:
+            message: Message to show
+        """
+        self._clear_lines(2 if self._notice_shown else 1)
+        print(message)
+        self._notice_shown = True
 
     def _process_single_rom(self, rom_index: int):
         """Process a single ROM interactively
@@ -218,45 +371,37 @@ class InteractiveMatcher:
         Args:
             rom_index: Index in self.games_list
         """
-        # Clear screen for clean display
-        self._clear_screen()
-
         crc, rom_info = self.games_list[rom_index]
 
         # Convert dict to ROMInfo object
         rom = self._dict_to_rom_info(rom_info)
 
         # Show current ROM info
-        current_position = len(self._processed_roms) + 1
+        current_position = self._processed_count + 1
         self._display_rom_info(rom, current_position, len(self.games_list))
 
         # Get similar games (limit to 5) - suppress database load messages
-        old_stdout = sys.stdout
-        sys.stdout = io.StringIO()
-
-        try:
-            similar_games = self.matcher.find_similar_games(rom, limit=5)
-        finally:
-            sys.stdout = old_stdout
+        similar_games = self._find_similar_games(rom)
 
         # Interactive selection
         try:
             result = self._interactive_select(rom, similar_games)
 
             # Mark as processed
-            self._processed_roms.add(rom_index)
+            self._mark_processed(rom_index)
 
             if result == 'quit':
                 return
             elif result == 'skip':
                 self.skipped_count += 1
-                print("⊘ Skipped")
-                time.sleep(0.3)
+                self._toasts.append("⊘ Skipped: {}".format(rom.filename))
             elif isinstance(result, dict):
                 # Matched successfully
                 if self.matcher.save_manual_match(crc, result, rom_info):
-                    # Show success message briefly
-                    print("\n✓ Saved: {} -> {}".format(rom.filename, result.get('name')))
+                    if self._similar_cache.pop(self._similar_cache_key(rom), None) is not None:
+                        self._similar_cache_dirty = True
+                    # Show success message on the next screen
+                    self._toasts.append("✓ Saved: {} -> {}".format(rom.filename, result.get('name')))
                     self.fixed_count += 1
 
                     # Rename ROM file if auto_rename is enabled
@@ -265,36 +410,122 @@ class InteractiveMatcher:
                         rom.game_name = result.get('name')
                         success, rename_result = rename_rom(rom, result.get('name'))
                         if success:
-                            print("  ✓ Renamed to: {}".format(rom.filename))
+                            self._toasts.append("  ✓ Renamed to: {}".format(rom.filename))
                             self.renamed_count += 1
 
                             # Update manual_matches.json with new path and filename
                             self.matcher.update_manual_match_paths(crc, rom.path, rom.filename)
                         elif "require specific filenames" not in rename_result:
-                            print("  ⚠️  Rename failed: {}".format(rename_result))
-
-                    # Pause briefly to show success
-                    time.sleep(0.5)
+                            self._toasts.append("  ⚠️  Rename failed: {}".format(rename_result))
                 else:
                     print("\n✗ Failed to save match for {}".format(rom.filename))
                     input("Press Enter to continue...")
                     # Remove from processed if failed
-                    self._processed_roms.remove(rom_index)
+                    self._unmark_processed(rom_index)
 
         except KeyboardInterrupt:
             print("\n\nInterrupted by user")
             # Don't mark as processed if interrupted
-            if rom_index in self._processed_roms:
-                self._processed_roms.remove(rom_index)
+            self._unmark_processed(rom_index)
             return
         except Exception as e:
             print("\nError: {}".format(e))
             input("Press Enter to continue...")
             # Don't mark as processed if error
-            if rom_index in self._processed_roms:
-                self._processed_roms.remove(rom_index)
+            self._unmark_processed(rom_index)
+
+
 
+    @staticmethod
+    def _similar_cache_key(rom: ROMInfo) -> Tuple[str, str]:
+        """Key identifying a ROM in the similar-games cache"""
+        return (rom.crc32 or rom.filename, rom.system)
+
+    def _find_similar_games(self, rom: ROMInfo) -> List[Tuple[Dict, float]]:
+        """Find up to 5 similar games, reusing results for revisited ROMs
+
+        Args:
+            rom: ROMInfo object
 
+        Returns:
+            List of (game_entry, score) tuples
+        """
+        key = self._similar_cache_key(rom)
+        similar_games = self._similar_cache.pop(key, None)
+        if similar_games is None:
+            similar_games = self.matcher.find_similar_games(rom, limit=5, quiet=True)
+            self._similar_cache_dirty = True
+            if len(self._similar_cache) >= self.SIMILAR_CACHE_SIZE:
+                # Evict the least recently used entry (dicts keep insertion order)
+                del self._similar_cache[next(iter(self._similar_cache))]
+        # (Re)insert at the end to mark the entry as most recently used
+        self._similar_cache[key] = similar_games
+        return similar_games
+
+    def _database_mtime(self, system: str) -> Optional[int]:
+        """Get the modification time of a system's database file
+
+        Args:
+            system: System name
+
+        Returns:
+            mtime in nanoseconds, or None if the database is not available
+        """
+        db_name = (self.config.get(f"cores.{system}") or {}).get("db_name")
+        if not db_name:
+            return None
+        try:
+            return (self.config.database_path / db_name).stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _load_similar_cache(self):
+        """Load similar-game results saved by earlier sessions
+
+        Entries are dropped when their system's database changed since they
+        were saved.
+        """
+        if not self.similar_cache_path.exists():
+            return
+
+        try:
+            data = load_json_file(self.similar_cache_path)
+        except Exception as e:
+            print("Warning: Failed to load similar games cache: {}".format(e))
+            return
+
+        saved_mtimes = data.get('databases', {})
+        current_mtimes = {}
+        for rom_key, system, similar_games in data.get('entries', []):
+            if system not in current_mtimes:
+                current_mtimes[system] = self._database_mtime(system)
+            if current_mtimes[system] is None or current_mtimes[system] != saved_mtimes.get(system):
+                self._similar_cache_dirty = True
+                continue
+            self._similar_cache[(rom_key, system)] = [tuple(item) for item in similar_games]
+
+    def _save_similar_cache(self):
+        """Write the similar-game cache for later sessions, if it changed"""
+        if not self._similar_cache_dirty:
+            return
+
+        systems = {system for _, system in self._similar_cache}
+        data = {
+            'databases': {system: self._database_mtime(system) for system in systems},
+            'entries': [
+                [rom_key, system, similar_games]
+                for (rom_key, system), similar_games in self._similar_cache.items()
+            ],
+        }
+
+        # Write to a temporary file first so an interrupted save keeps the old cache
+        tmp_path = self.similar_cache_path.with_suffix('.tmp')
+        try:
+            save_json_file(tmp_path, data, indent=False)
+            os.replace(tmp_path, self.similar_cache_path)
+            self._similar_cache_dirty = False
+        except Exception as e:
+            print("Warning: Failed to save similar games cache: {}".format(e))
 
     def _dict_to_rom_info(self, rom_dict: Dict) -> ROMInfo:
         """Convert dictionary to ROMInfo object
@@ -305,12 +536,11 @@ class InteractiveMatcher:
         Returns:
             ROMInfo object
         """
-        file_path = Path(rom_dict['path'])
         return ROMInfo(
             path=rom_dict['path'],
             filename=rom_dict['filename'],
             system=rom_dict['system'],
-            extension=file_path.suffix,
+            extension=os.path.splitext(rom_dict['path'])[1],
             size=rom_dict.get('size', 0),
             size_formatted=rom_dict.get('size_formatted', '0 B'),
             crc32=rom_dict.get('crc32'),
@@ -326,31 +556,25 @@ class InteractiveMatcher:
             current: Current ROM index
             total: Total number of ROMs
         """
-        print("=" * 60)
-        print("[{}/{}] {} ({})".format(current, total, rom.filename, rom.system))
-        print("CRC32: {} | Region: {}".format(rom.crc32 or 'N/A', rom.region or 'N/A'))
-        print("=" * 60)
+        # Clear screen for clean display
+        self._render_frame([
+            "=" * 60,
+            "[{}/{}] {} ({})".format(current, total, rom.filename, rom.system),
+            "CRC32: {} | Region: {}".format(rom.crc32 or 'N/A', rom.region or 'N/A'),
+            "=" * 60,
+        ], clear=True)
 
-    def _display_similar_games(self, similar_games: List[Tuple[Dict, float]], quiet: bool = False):
-        """Display list of similar games (compact, max 5 items)
+    def _format_similar_games(self, similar_games: List[Tuple[Dict, float]]) -> List[str]:
+        """Format similar games as menu rows (max 5 items)
 
         Args:
-            similar_games: List of (game_entry, score) tuples (max 5)
-            quiet: If True, suppress output (for loading databases)
-        """
-        if quiet:
-            return
+            similar_games: List of (game_entry, score) tuples
 
-        if not similar_games:
-            print("⚠️  No similar games found")
-            return
-
-        print("Similar games:")
+        Returns:
+            One display row per game
+        """
+        rows = []
         for i, (entry, score) in enumerate(similar_games[:5], 1):
-            name = entry.get('name', 'Unknown')
-            region = entry.get('region', 'N/A')
-            year = entry.get('releaseyear', 'N/A')
-
             # Color indicator based on similarity
             if score > 0.8:
                 marker = "🟢"
@@ -359,9 +583,30 @@ class InteractiveMatcher:
             else:
                 marker = "🔴"
 
-            print("  {} {}. {} | {} | {} | {:.1%}".format(
-                marker, i, name, region, year, score
+            rows.append("  {} {}. {} | {} | {} | {:.1%}".format(
+                marker, i,
+                entry.get('name', 'Unknown'),
+                entry.get('region', 'N/A'),
+                entry.get('releaseyear', 'N/A'),
+                score
             ))
+        return rows
+
+    def _display_similar_games(self, rows: List[str], quiet: bool = False):
+        """Display list of similar games (compact, max 5 items)
+
+        Args:
+            rows: Rows built by _format_similar_games
+            quiet: If True, suppress output (for loading databases)
+        """
+        if quiet:
+            return
+
+        if not rows:
+            print("⚠️  No similar games found")
+            return
+
+        self._render_frame(["Similar games:"] + rows)
 
     def _interactive_select(self, rom: ROMInfo, similar_games: List[Tuple[Dict, float]]) -> any:
         """Interactive selection using arrow keys or commands
@@ -373,7 +618,7 @@ class InteractiveMatcher:
         Returns:
             Selected game dict, or command string ('skip', 'quit', 'all')
         """
-        self._display_similar_games(similar_games)
+        self._display_similar_games(self._format_similar_games(similar_games))
 
         if not similar_games:
             # No matches found - allow skip
@@ -445,10 +690,11 @@ class InteractiveMatcher:
             return 'skip'
 
         # Clear and show search screen
-        self._clear_screen()
-        print("=" * 60)
-        print("Search Results: {}".format(query))
-        print("=" * 60)
+        self._render_frame([
+            "=" * 60,
+            "Search Results: {}".format(query),
+            "=" * 60,
+        ], clear=True)
 
         system = rom.system
 
@@ -462,6 +708,8 @@ class InteractiveMatcher:
 
         # Search for entries
         entries = []
+        # Set when matches beyond MAX_SEARCH_RESULTS were left unscanned
+        truncated = False
         if database['type'] == 'rdb':
             try:
                 entries = self.matcher.rdb_query.find_by_name_glob(database['path'], '*{}*'.format(query))
@@ -470,10 +718,14 @@ class InteractiveMatcher:
                 input("Press Enter to continue...")
                 return 'skip'
         else:
+            data, names_lower = self.matcher.get_entries(database)
+
             query_lower = query.lower()
-            for entry in database['data']:
-                entry_name = entry.get('name', '').lower()
-                if query_lower in entry_name:
+            for entry, name_lower in zip(data, names_lower):
+                if query_lower in name_lower:
+                    if len(entries) >= self.MAX_SEARCH_RESULTS:
+                        truncated = True
+                        break
                     entries.append(entry)
 
         if not entries:
@@ -483,17 +735,20 @@ class InteractiveMatcher:
 
         # Show results (max 10)
         display_limit = min(10, len(entries))
+        lines = []
         for i, entry in enumerate(entries[:display_limit], 1):
             name = entry.get('name', 'Unknown')
             region = entry.get('region', 'N/A')
             year = entry.get('releaseyear', 'N/A')
-            print("  {}. {} | {} | {}".format(i, name, region, year))
+            lines.append("  {}. {} | {} | {}".format(i, name, region, year))
 
-        if len(entries) > display_limit:
-            print("  ... and {} more results".format(len(entries) - display_limit))
+        if truncated:
+            lines.append("  ... and more results, refine the query to narrow them down")
+        elif len(entries) > display_limit:
+            lines.append("  ... and {} more results".format(len(entries) - display_limit))
 
-        print("  0. Cancel")
-        print("=" * 60)
+        lines += ["  0. Cancel", "=" * 60]
+        self._render_frame(lines)
 
         # Get selection
         while True:
@@ -535,20 +790,22 @@ class InteractiveMatcher:
             query = default_query
 
         # Clear and show search screen
-        self._clear_screen()
-        print("=" * 60)
-        print("Online Search: {}".format(query))
-        print("=" * 60)
-        print("Searching LaunchBox...")
+        self._render_frame([
+            "=" * 60,
+            "Online Search: {}".format(query),
+            "=" * 60,
+            "Searching LaunchBox...",
+        ], clear=True)
 
         # Import LaunchBox plugin
         try:
-            from ..plugins.launchbox import LaunchBoxFetcher
+            if self._launchbox is None:
+                from ..plugins.launchbox import LaunchBoxFetcher
 
-            launchbox = LaunchBoxFetcher(self.config.get("fetch_sources", {}).get("launchbox", {}))
+                self._launchbox = LaunchBoxFetcher(self.config.get("fetch_sources", {}).get("launchbox", {}))
 
             # Search LaunchBox
-            result = launchbox.search_game(query, rom.system)
+            result = self._launchbox.search_game(query, rom.system)
             
             if result.success and result.data:
                 entries = result.data
@@ -558,8 +815,7 @@ class InteractiveMatcher:
                     input("Press Enter to continue...")
                     return 'skip'
                 else:
-                    print("Found {} results on LaunchBox".format(len(entries)))
-                    print()
+                    lines = ["Found {} results on LaunchBox".format(len(entries)), ""]
 
                     # Show results (max 15)
                     display_limit = min(15, len(entries))
@@ -567,17 +823,16 @@ class InteractiveMatcher:
                         name = entry.get('name', 'Unknown')
                         platform = entry.get('platform', 'N/A')
                         year = entry.get('releaseyear', 'N/A')
-                        print("  {}. {} | {}{}".format(
+                        lines.append("  {}. {} | {}{}".format(
                             i, name, platform,
                             " | {}".format(year) if year != 'N/A' else ''
                         ))
 
                     if len(entries) > display_limit:
-                        print("  ... and {} more results".format(len(entries) - display_limit))
+                        lines.append("  ... and {} more results".format(len(entries) - display_limit))
 
-                    print()
-                    print("  0. Cancel")
-                    print("=" * 60)
+                    lines += ["", "  0. Cancel", "=" * 60]
+                    self._render_frame(lines)
 
                     # Get selection
                     while True:
@@ -597,7 +852,7 @@ class InteractiveMatcher:
                                 game_key = selected.get('id', '')
                                 game_name = selected.get('name', '').replace(' ', '-').lower()
                                 # URL encode and clean the name
-                                game_name_clean = re.sub(r'[^a-z0-9-]', '', game_name)
+                                game_name_clean = _URL_CLEAN_RE.sub('', game_name)
                                 details_url = "https://gamesdb.launchbox-app.com/games/details/{}-{}".format(
                                     game_key, game_name_clean
                                 )
@@ -633,16 +888,20 @@ class InteractiveMatcher:
 
     def _print_summary(self):
         """Print matching session summary"""
-        self._clear_screen()
-        print("=" * 60)
-        print("Matching Summary")
-        print("=" * 60)
-        print("Fixed:   {}".format(self.fixed_count))
-        print("Skipped: {}".format(self.skipped_count))
+        lines = [
+            "=" * 60,
+            "Matching Summary",
+            "=" * 60,
+            "Fixed:   {}".format(self.fixed_count),
+            "Skipped: {}".format(self.skipped_count),
+        ]
         if self.auto_rename and self.renamed_count > 0:
-            print("Renamed: {}".format(self.renamed_count))
-        print("Total:   {}".format(len(self.games_list)))
-        print()
-        print("Manual matches: {}".format(self.manual_matches_path))
-        print("=" * 60)
-        print()
+            lines.append("Renamed: {}".format(self.renamed_count))
+        lines += [
+            "Total:   {}".format(len(self.games_list)),
+            "",
+            "Manual matches: {}".format(self.manual_matches_path),
+            "=" * 60,
+            "",
+        ]
+        self._render_frame(lines, clear=True)
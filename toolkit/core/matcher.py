@@ -3,14 +3,73 @@ ROM Matcher Module
 Matches ROMs to game databases
 """
 
-import json
+import os
+import pickle
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 from difflib import SequenceMatcher
 
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:  # Optional: falls back to difflib.SequenceMatcher
+    process = None
+
 from .models import ROMInfo
 from .rdb_query import LibretroDBQuery
-from .utils import rename_rom
+from .utils import rename_rom, load_json_file, save_json_file
+
+
+# Default for match_scanned_rom's db_match: look the ROM up in the database
+_UNSET = object()
+
+# Parsed RDB entries are pickled here so later runs skip the libretrodb_tool dump.
+# Kept apart from the "databases" directory the RetroArch DB fetcher downloads into.
+DB_CACHE_DIR = Path.home() / ".cache" / "retroarch_toolkit" / "parsed_databases"
+
+
+@lru_cache(maxsize=64)
+def _load_database_entries(db_path: str, mtime_ns: int) -> Tuple[Dict, ...]:
+    """Load all entries of a game database, parsed once per process
+
+    RDB entries are also kept in a pickle cache across runs.
+
+    Args:
+        db_path: Path to RDB or JSON database file
+        mtime_ns: Modification time of the file (part of the cache key so
+                  a re-downloaded database is parsed again)
+
+    Returns:
+        Tuple of game entries
+    """
+    path = Path(db_path)
+    if path.suffix != '.rdb':
+        return tuple(load_json_file(path))
+
+    cache_path = DB_CACHE_DIR / f"{path.stem}.pkl"
+    try:
+        with open(cache_path, 'rb') as f:
+            cached_path, cached_mtime_ns, entries = pickle.load(f)
+        if cached_path == db_path and cached_mtime_ns == mtime_ns:
+            return entries
+    except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+        pass  # Missing or unreadable cache, parse the database
+
+    entries = tuple(LibretroDBQuery().list_all(path))
+
+    if entries:
+        try:
+            DB_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix('.tmp')
+            with open(tmp_path, 'wb') as f:
+                pickle.dump((db_path, mtime_ns, entries), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"Warning: Could not write database cache: {e}")
+
+    return entries
 
 
 class ROMMatcher:
@@ -28,28 +87,31 @@ class ROMMatcher:
         self.rdb_query = LibretroDBQuery()
         self.missing_databases = set()  # Track missing databases
 
-    def load_database(self, system: str, db_path: Optional[str] = None) -> bool:
+    def load_database(self, system: str, db_path: Optional[str] = None, quiet: bool = False) -> bool:
         """Load game database for a system
 
         Args:
             system: System name
             db_path: Path to database file (uses config if None)
+            quiet: If True, do not print load status or errors
 
         Returns:
             True if successful
         """
         if db_path is None:
             # Try to find database in config path
-            db_dir = Path(self.config.get("database_path"))
+            db_dir = self.config.database_path
             core_config = self.config.get(f"cores.{system}")
 
             if not core_config:
-                print(f"Error: System not found in config: {system}")
+                if not quiet:
+                    print(f"Error: System not found in config: {system}")
                 return False
 
             db_name = core_config.get("db_name")
             if not db_name:
-                print(f"Error: No database name configured for {system}")
+                if not quiet:
+                    print(f"Error: No database name configured for {system}")
                 return False
 
             db_path = db_dir / db_name
@@ -58,41 +120,141 @@ class ROMMatcher:
 
         # Check if database exists
         if not db_path.exists():
-            print(f"Warning: Database not found: {db_path}")
+            if not quiet:
+                print(f"Warning: Database not found: {db_path}")
             self.missing_databases.add(system)
             return False
 
         try:
             # Use libretrodb_tool for RDB files, fallback to JSON
             if db_path.suffix == '.rdb':
-                # Check if RDB is accessible via libretrodb_tool
-                if self.rdb_query.check_db_exists(db_path):
+                # Listing the RDB validates it; the entries are cached (on disk
+                # across runs) for the lookups that follow, so this is the only dump
+                try:
+                    entries = _load_database_entries(str(db_path), db_path.stat().st_mtime_ns)
+                except (FileNotFoundError, RuntimeError):
+                    entries = ()
+
+                if entries:
                     # Store the database path for later queries
                     self.databases[system] = {
                         'type': 'rdb',
                         'path': db_path
                     }
-                    print(f"Loaded RDB database for {system}: {db_path.name}")
+                    if not quiet:
+                        print(f"Loaded RDB database for {system}: {db_path.name}")
                     return True
                 else:
-                    print(f"Error: Cannot access RDB database: {db_path}")
+                    if not quiet:
+                        print(f"Error: Cannot access RDB database: {db_path}")
                     return False
             elif db_path.suffix == '.json':
-                with open(db_path, 'r', encoding='utf-8') as f:
-                    self.databases[system] = {
-                        'type': 'json',
-                        'data': json.load(f)
-                    }
-                print(f"Loaded JSON database for {system}: {len(self.databases[system]['data'])} entries")
+                data = _load_database_entries(str(db_path), db_path.stat().st_mtime_ns)
+                self.databases[system] = {
+                    'type': 'json',
+                    'data': data,
+                    'crc_index': self._build_crc_index(data),
+                    'name_index': self._build_name_index(data)
+                }
+                if not quiet:
+                    print(f"Loaded JSON database for {system}: {len(self.databases[system]['data'])} entries")
                 return True
             else:
-                print(f"Error: Unsupported database format: {db_path.suffix}")
+                if not quiet:
+                    print(f"Error: Unsupported database format: {db_path.suffix}")
                 return False
 
         except Exception as e:
-            print(f"Error loading database {db_path}: {e}")
+            if not quiet:
+                print(f"Error loading database {db_path}: {e}")
             return False
 
+    @staticmethod
+    def _build_crc_index(entries) -> Dict[str, Dict]:
+        """Build a CRC32 -> entry lookup table
+
+        Args:
+            entries: Game database entries
+
+        Returns:
+            Dictionary mapping lowercase CRC32 to the first entry with that CRC
+        """
+        crc_index = {}
+        for entry in entries:
+            crc = entry.get('crc')
+            if crc:
+                crc_index.setdefault(crc.lower(), entry)
+        return crc_index
+
+    @staticmethod
+    def _build_name_index(entries) -> Dict[str, Dict]:
+        """Build a lowercase name -> entry lookup table
+
+        Args:
+            entries: Game database entries
+
+        Returns:
+            Dictionary mapping lowercase name to the first entry with that name
+        """
+        name_index = {}
+        for entry in entries:
+            name_index.setdefault(entry.get('name', '').lower(), entry)
+        return name_index
+
+    def _prime_rdb_indices(self, database: Dict) -> bool:
+        """Build CRC32 and name lookup tables for an RDB database
+
+        The RDB is listed once (through the shared entry cache) so matching
+        many ROMs does not start a libretrodb_tool process per lookup.
+
+        Args:
+            database: RDB database metadata
+
+        Returns:
+            True if the lookup tables are available
+        """
+        if 'crc_index' not in database:
+            try:
+                entries, _ = self.get_entries(database)
+            except Exception as e:
+                print(f"Warning: Cannot list RDB database, querying per ROM: {e}")
+                entries = ()
+
+            if entries:
+                database['crc_index'] = self._build_crc_index(entries)
+                database['name_index'] = self._build_name_index(entries)
+            else:
+                # Listing failed or returned nothing, keep using per-ROM queries
+                database['crc_index'] = None
+
+        return database['crc_index'] is not None
+
+    def get_entries(self, database: Dict) -> Tuple[Tuple[Dict, ...], List[str]]:
+        """Get all entries of a loaded database with their lowercased names
+
+        Both are stored in the database metadata on first access, so later
+        calls neither list the RDB again nor re-lowercase every name. The
+        names are kept beside the entries rather than on them, since matched
+        entries are written to manual_matches.json. load_database replaces
+        the metadata, which drops them.
+
+        Args:
+            database: Game database metadata
+
+        Returns:
+            Tuple of (game entries, lowercased names in the same order)
+        """
+        names_lower = database.get('names_lower')
+        if names_lower is None:
+            if database['type'] == 'rdb':
+                db_path = database['path']
+                database['entries'] = _load_database_entries(str(db_path), db_path.stat().st_mtime_ns)
+            else:
+                database['entries'] = database['data']
+            names_lower = [entry.get('name', '').lower() for entry in database['entries']]
+            database['names_lower'] = names_lower
+        return database['entries'], names_lower
+
     def _parse_rdb(self, db_path: Path) -> List[Dict]:
         """Parse RetroArch RDB format using libretrodb_tool
 
@@ -152,20 +314,15 @@ class ROMMatcher:
         Returns:
             Matched entry or None
         """
-        if database['type'] == 'rdb':
-            # Use libretrodb_tool for RDB databases
+        if database['type'] == 'rdb' and not self._prime_rdb_indices(database):
+            # Query libretrodb_tool when the RDB could not be listed
             try:
                 return self.rdb_query.find_by_crc32(database['path'], crc32)
             except Exception as e:
                 print(f"Error querying RDB: {e}")
                 return None
-        else:
-            # Fallback to JSON search
-            crc32_lower = crc32.lower()
-            for entry in database['data']:
-                if entry.get('crc', '').lower() == crc32_lower:
-                    return entry
-            return None
+
+        return database['crc_index'].get(crc32.lower())
 
     def _match_by_name(self, normalized_name: str, database: Dict) -> Optional[Dict]:
         """Match by normalized name
@@ -177,8 +334,8 @@ class ROMMatcher:
         Returns:
             Matched entry or None
         """
-        if database['type'] == 'rdb':
-            # Try glob pattern matching with libretrodb_tool
+        if database['type'] == 'rdb' and not self._prime_rdb_indices(database):
+            # Try glob pattern matching with libretrodb_tool when the RDB could not be listed
             try:
                 # Try exact match first
                 results = self.rdb_query.find_by_name_glob(database['path'], normalized_name)
@@ -188,14 +345,8 @@ class ROMMatcher:
             except Exception as e:
                 print(f"Error querying RDB: {e}")
                 return None
-        else:
-            # Fallback to JSON search
-            normalized_lower = normalized_name.lower()
-            for entry in database['data']:
-                entry_name = entry.get('name', '').lower()
-                if entry_name == normalized_lower:
-                    return entry
-            return None
+
+        return database['name_index'].get(normalized_name.lower())
 
     def _fuzzy_match(self, normalized_name: str, database: Dict,
                      threshold: float = 0.8) -> Optional[Dict]:
@@ -215,19 +366,21 @@ class ROMMatcher:
         normalized_lower = normalized_name.lower()
 
         # Get all entries for fuzzy matching
-        entries = []
-        if database['type'] == 'rdb':
-            try:
-                # Try wildcard search to get candidates
-                entries = self.rdb_query.find_by_name_glob(database['path'], '*')
-            except Exception as e:
-                print(f"Error querying RDB for fuzzy match: {e}")
-                return None
-        else:
-            entries = database['data']
+        try:
+            entries, names = self.get_entries(database)
+        except Exception as e:
+            print(f"Error querying RDB for fuzzy match: {e}")
+            return None
 
-        for entry in entries:
-            entry_name = entry.get('name', '').lower()
+        if process is not None:
+            result = process.extractOne(normalized_lower, names, scorer=fuzz.ratio,
+                                        score_cutoff=threshold * 100)
+            # extractOne accepts ties at the cutoff; keep the strict comparison
+            if result and result[1] > threshold * 100:
+                return entries[result[2]]
+            return None
+
+        for entry, entry_name in zip(entries, names):
             score = SequenceMatcher(None, normalized_lower, entry_name).ratio()
 
             if score > best_score:
@@ -236,71 +389,164 @@ class ROMMatcher:
 
         return best_match
 
-    def match_all_roms(self, roms: List[ROMInfo], auto_rename: bool = False) -> Tuple[int, int]:
+    def match_all_roms(self, roms: List[ROMInfo], auto_rename: bool = False,
+                       jobs: Optional[int] = None) -> Tuple[int, int]:
         """Match all ROMs to database
 
+        With more than one job, database lookups run on a thread pool; ROM info,
+        renames and stats are then updated in order on the calling thread.
+
         Args:
             roms: List of ROM information
             auto_rename: Automatically rename matched ROMs to their game names
+            jobs: Number of lookup threads (scan_options.match_jobs if None; 1 matches sequentially)
 
         Returns:
             Tuple of (matched_count, total_count)
         """
-        matched = 0
         total = len(roms)
-        renamed_count = 0
-        skipped_arcade_count = 0
-
         print(f"Matching {total} ROMs to database...")
 
-        # First, apply manual matches
-        manual_matched = self.apply_manual_matches(roms, auto_rename)
-        matched += manual_matched
+        if jobs is None:
+            jobs = self.config.get("scan_options.match_jobs") or 1
+
+        manual_matches = self.load_manual_matches()
+
+        # ROMs that need a database lookup (not already or manually matched)
+        pending = [rom for rom in roms
+                   if not rom.matched and not (rom.crc32 and rom.crc32 in manual_matches)]
+        db_matches = {}
+        if jobs > 1 and len(pending) > 1:
+            self._prepare_databases({rom.system for rom in pending})
+            with ThreadPoolExecutor(max_workers=jobs) as executor:
+                db_matches = dict(zip(map(id, pending), executor.map(self.match_rom, pending)))
 
-        # Then try automatic matching for remaining ROMs
+        stats = Counter()
         for rom in roms:
-            if rom.matched:
-                continue  # Already matched by manual matches
+            self.match_scanned_rom(rom, manual_matches, stats, auto_rename,
+                                   db_match=db_matches.get(id(rom), _UNSET))
 
-            match = self.match_rom(rom)
+        return self.report_match_stats(stats, total, auto_rename)
 
-            if match:
-                # Update ROM info with matched data
-                rom.matched = True
-                rom.game_name = match.get('name')
-                rom.release_year = match.get('releaseyear')
-                rom.developer = match.get('developer')
-                rom.publisher = match.get('publisher')
-                matched += 1
+    def _prepare_databases(self, systems):
+        """Load databases and their lookup tables before matching in threads
 
-                # Rename ROM file if auto_rename is enabled
-                if auto_rename and rom.game_name:
-                    success, result = rename_rom(rom, rom.game_name)
-                    if success:
-                        renamed_count += 1
-                    elif "require specific filenames" in result:
-                        # Count skipped arcade ROMs but don't print individual warnings
-                        skipped_arcade_count += 1
-                    else:
-                        print(f"  Warning: Failed to rename {rom.filename}: {result}")
-            else:
+        Doing this up front keeps worker threads from loading or indexing
+        the same database at the same time.
+
+        Args:
+            systems: System names to prepare
+        """
+        for system in systems:
+            if system not in self.databases and not self.load_database(system):
+                continue
+
+            database = self.databases[system]
+            try:
+                self.get_entries(database)
+            except Exception:
+                continue  # Reported by the lookups themselves
+            if database['type'] == 'rdb':
+                self._prime_rdb_indices(database)
+
+    def match_scanned_rom(self, rom: ROMInfo, manual_matches: Dict, stats: Counter,
+                          auto_rename: bool = False, db_match=_UNSET) -> bool:
+        """Match one ROM, preferring its manual match over the database
+
+        Lets callers match each ROM as soon as it is scanned instead of in a
+        second pass over the whole list.
+
+        Args:
+            rom: ROM information
+            manual_matches: Manual matches from load_manual_matches()
+            stats: Counter updated with match and rename counts
+            auto_rename: Automatically rename matched ROMs to their game names
+            db_match: Result of match_rom() if already looked up (looked up here if not given)
+
+        Returns:
+            True if the ROM is matched
+        """
+        if rom.matched:
+            return True  # Already matched
+
+        # Manual matches take priority over database matches
+        manual_match = manual_matches.get(rom.crc32) if rom.crc32 else None
+        if manual_match:
+            rom.matched = True
+            rom.game_name = manual_match.get('matched_name')
+            rom.release_year = manual_match.get('release_year')
+            rom.developer = manual_match.get('developer')
+            rom.publisher = manual_match.get('publisher')
+            stats['manual'] += 1
+            prefix = 'manual_'
+        else:
+            match = self.match_rom(rom) if db_match is _UNSET else db_match
+            if not match:
                 # Add to unknown games list
                 self.unknown_games.append(rom)
+                return False
+
+            # Update ROM info with matched data
+            rom.matched = True
+            rom.game_name = match.get('name')
+            rom.release_year = match.get('releaseyear')
+            rom.developer = match.get('developer')
+            rom.publisher = match.get('publisher')
+            stats['auto'] += 1
+            prefix = ''
+
+        # Rename ROM file if auto_rename is enabled
+        if auto_rename and rom.game_name:
+            success, result = rename_rom(rom, rom.game_name)
+            if success:
+                stats[prefix + 'renamed'] += 1
+                if manual_match:
+                    # Update manual_matches.json with new path and filename
+                    self.update_manual_match_paths(rom.crc32, rom.path, rom.filename)
+            elif "require specific filenames" in result:
+                # Count skipped arcade ROMs but don't print individual warnings
+                stats[prefix + 'skipped_arcade'] += 1
+            else:
+                print(f"  Warning: Failed to rename {rom.filename}: {result}")
+
+        return True
+
+    def report_match_stats(self, stats: Counter, total: int, auto_rename: bool = False) -> Tuple[int, int]:
+        """Print the summary for ROMs matched with match_scanned_rom
+
+        Args:
+            stats: Counter filled by match_scanned_rom
+            total: Number of ROMs processed
+            auto_rename: Whether ROMs were renamed
 
-        print(f"Matched {matched}/{total} ROMs ({matched/total*100:.1f}%)")
+        Returns:
+            Tuple of (matched_count, total_count)
+        """
+        if stats['manual'] > 0:
+            print(f"Applied {stats['manual']} manual matches")
+            if auto_rename:
+                if stats['manual_renamed'] > 0:
+                    print(f"  Renamed {stats['manual_renamed']} ROM files from manual matches")
+                if stats['manual_skipped_arcade'] > 0:
+                    print(f"  Skipped {stats['manual_skipped_arcade']} arcade ROM(s) from manual matches")
+
+        matched = stats['manual'] + stats['auto']
+        print(f"Matched {matched}/{total} ROMs ({matched/total*100:.1f}%)" if total else "Matched 0/0 ROMs")
         if auto_rename:
-            if renamed_count > 0:
-                print(f"Renamed {renamed_count} ROM files")
-            if skipped_arcade_count > 0:
-                print(f"Skipped {skipped_arcade_count} arcade ROM(s) (arcade ROMs require specific filenames)")
+            if stats['renamed'] > 0:
+                print(f"Renamed {stats['renamed']} ROM files")
+            if stats['skipped_arcade'] > 0:
+                print(f"Skipped {stats['skipped_arcade']} arcade ROM(s) (arcade ROMs require specific filenames)")
         return matched, total
 
-    def find_similar_games(self, rom_info: ROMInfo, limit: int = 5) -> List[Tuple[Dict, float]]:
+    def find_similar_games(self, rom_info: ROMInfo, limit: int = 5,
+                           quiet: bool = False) -> List[Tuple[Dict, float]]:
         """Find similar games for unmatched ROM
 
         Args:
             rom_info: ROM information
             limit: Maximum number of results
+            quiet: If True, load the database without printing status
 
         Returns:
             List of (game_entry, similarity_score) tuples
@@ -308,26 +554,27 @@ class ROMMatcher:
         system = rom_info.system
 
         if system not in self.databases:
-            if not self.load_database(system):
+            if not self.load_database(system, quiet=quiet):
                 return []
 
         database = self.databases[system]
         normalized_lower = rom_info.normalized_name.lower()
 
         # Get all entries
-        entries = []
-        if database['type'] == 'rdb':
-            try:
-                entries = self.rdb_query.find_by_name_glob(database['path'], '*')
-            except Exception:
-                return []
-        else:
-            entries = database['data']
+        try:
+            entries, names = self.get_entries(database)
+        except Exception:
+            return []
+
+        if process is not None:
+            # WRatio also scores reordered titles ("Legend of Zelda, The") well,
+            # which suits suggestions better than the plain ratio used for matching
+            results = process.extract(normalized_lower, names, scorer=fuzz.WRatio, limit=limit)
+            return [(entries[index], score / 100) for _, score, index in results]
 
         # Calculate similarity scores for all games
         similarities = []
-        for entry in entries:
-            entry_name = entry.get('name', '').lower()
+        for entry, entry_name in zip(entries, names):
             score = SequenceMatcher(None, normalized_lower, entry_name).ratio()
             similarities.append((entry, score))
 
@@ -361,14 +608,13 @@ class ROMMatcher:
             print("No unknown games to save")
             return True
 
-        unknown_db_path = Path(self.config.get("unknown_games_db"))
+        unknown_db_path = self.config.unknown_games_db
 
         try:
             # Load existing unknown games if file exists
             existing_unknown = {}
             if unknown_db_path.exists():
-                with open(unknown_db_path, 'r', encoding='utf-8') as f:
-                    existing_unknown = json.load(f)
+                existing_unknown = load_json_file(unknown_db_path)
 
             # Add new unknown games
             for rom in self.unknown_games:
@@ -391,8 +637,7 @@ class ROMMatcher:
                     }
 
             # Save to file
-            with open(unknown_db_path, 'w', encoding='utf-8') as f:
-                json.dump(existing_unknown, f, indent=2, ensure_ascii=False)
+            save_json_file(unknown_db_path, existing_unknown)
 
             print(f"Saved {len(self.unknown_games)} unknown games to {unknown_db_path}")
             print("You can manually edit this file to add game information")
@@ -408,18 +653,72 @@ class ROMMatcher:
         Returns:
             Dictionary of manual matches
         """
-        manual_matches_path = Path(self.config.get("manual_matches_db", "manual_matches.json"))
+        manual_matches_path = self.config.manual_matches_db
 
         if not manual_matches_path.exists():
             return {}
 
         try:
-            with open(manual_matches_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return load_json_file(manual_matches_path)
         except Exception as e:
             print(f"Error loading manual matches: {e}")
             return {}
 
+    def load_manual_match_keys(self) -> frozenset:
+        """Load the CRC32 keys of manual_matches.json without parsing the entries
+
+        Keys are read from the manual_matches.keys sidecar (one CRC32 per line),
+        which is rebuilt from the JSON when missing or older than the JSON.
+
+        Returns:
+            Set of CRC32 strings with a manual match
+        """
+        manual_matches_path = self.config.manual_matches_db
+        keys_path = manual_matches_path.with_suffix('.keys')
+
+        if not manual_matches_path.exists():
+            return frozenset()
+
+        try:
+            if self._manual_match_keys_fresh():
+                return frozenset(keys_path.read_text(encoding='utf-8').split())
+
+            keys = frozenset(load_json_file(manual_matches_path))
+            keys_path.write_text(''.join(f"{key}\n" for key in keys), encoding='utf-8')
+            return keys
+        except Exception as e:
+            print(f"Error loading manual match keys: {e}")
+            return frozenset()
+
+    def _manual_match_keys_fresh(self) -> bool:
+        """Check whether manual_matches.keys is at least as new as manual_matches.json"""
+        manual_matches_path = self.config.manual_matches_db
+        keys_path = manual_matches_path.with_suffix('.keys')
+        try:
+            return keys_path.stat().st_mtime_ns >= manual_matches_path.stat().st_mtime_ns
+        except OSError:
+            return False
+
+    def _sync_manual_match_keys(self, keys_fresh: bool, new_key: Optional[str] = None):
+        """Keep manual_matches.keys in step after manual_matches.json was written
+
+        Args:
+            keys_fresh: Whether the keys file was up to date before the write
+            new_key: CRC32 added by the write, if any
+        """
+        if not keys_fresh:
+            return  # Rebuilt from the JSON on next load
+
+        keys_path = self.config.manual_matches_db.with_suffix('.keys')
+        try:
+            if new_key:
+                with open(keys_path, 'a', encoding='utf-8') as f:
+                    f.write(f"{new_key}\n")
+            else:
+                os.utime(keys_path)
+        except OSError as e:
+            print(f"Warning: Failed to update manual match keys: {e}")
+
     def save_manual_match(self, rom_crc32: str, matched_entry: Dict, rom_info: Dict) -> bool:
         """Save a manual match to manual_matches.json
 
@@ -431,14 +730,13 @@ class ROMMatcher:
         Returns:
             True if successful
         """
-        manual_matches_path = Path(self.config.get("manual_matches_db", "manual_matches.json"))
+        manual_matches_path = self.config.manual_matches_db
 
         try:
             # Load existing matches
             existing_matches = {}
             if manual_matches_path.exists():
-                with open(manual_matches_path, 'r', encoding='utf-8') as f:
-                    existing_matches = json.load(f)
+                existing_matches = load_json_file(manual_matches_path)
 
             # Add new match (will overwrite if key exists)
             match_data = {
@@ -464,11 +762,17 @@ class ROMMatcher:
             if 'source' in matched_entry:
                 match_data['source'] = matched_entry.get('source')
 
+            # Nothing to write if this exact match is already saved
+            if existing_matches.get(rom_crc32) == match_data:
+                return True
+
+            is_new_key = rom_crc32 not in existing_matches
             existing_matches[rom_crc32] = match_data
 
             # Save to file
-            with open(manual_matches_path, 'w', encoding='utf-8') as f:
-                json.dump(existing_matches, f, indent=2, ensure_ascii=False)
+            keys_fresh = self._manual_match_keys_fresh()
+            save_json_file(manual_matches_path, existing_matches)
+            self._sync_manual_match_keys(keys_fresh, rom_crc32 if is_new_key else None)
 
             return True
 
@@ -487,24 +791,28 @@ class ROMMatcher:
         Returns:
             True if successful
         """
-        manual_matches_path = Path(self.config.get("manual_matches_db", "manual_matches.json"))
+        manual_matches_path = self.config.manual_matches_db
 
         try:
             if not manual_matches_path.exists():
                 return False
 
             # Load existing matches
-            with open(manual_matches_path, 'r', encoding='utf-8') as f:
-                existing_matches = json.load(f)
+            existing_matches = load_json_file(manual_matches_path)
 
             # Update path and filename if this CRC exists
             if rom_crc32 in existing_matches:
+                match = existing_matches[rom_crc32]
+                if match.get('path') == new_path and match.get('filename') == new_filename:
+                    return True  # Already up to date, skip rewriting the file
+
                 existing_matches[rom_crc32]['path'] = new_path
                 existing_matches[rom_crc32]['filename'] = new_filename
 
                 # Save to file
-                with open(manual_matches_path, 'w', encoding='utf-8') as f:
-                    json.dump(existing_matches, f, indent=2, ensure_ascii=False)
+                keys_fresh = self._manual_match_keys_fresh()
+                save_json_file(manual_matches_path, existing_matches)
+                self._sync_manual_match_keys(keys_fresh)
 
                 return True
 
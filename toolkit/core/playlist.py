@@ -10,6 +10,7 @@ from urllib.parse import quote
 
 from .models import ROMInfo
 from .chinese_name_mapper import ChineseNameMapper
+from .utils import load_json_file
 
 
 class PlaylistGenerator:
@@ -31,14 +32,13 @@ class PlaylistGenerator:
         Returns:
             Dictionary of manual matches keyed by CRC32
         """
-        manual_matches_path = Path(self.config.get("manual_matches_db", "manual_matches.json"))
+        manual_matches_path = self.config.manual_matches_db
 
         if not manual_matches_path.exists():
             return {}
 
         try:
-            with open(manual_matches_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return load_json_file(manual_matches_path)
         except Exception as e:
             print(f"Warning: Error loading manual matches: {e}")
             return {}
@@ -53,7 +53,7 @@ class PlaylistGenerator:
         Returns:
             Dictionary mapping playlist name to file path
         """
-        playlists_path = Path(self.config.get("playlists_path"))
+        playlists_path = self.config.playlists_path
         playlists_path.mkdir(parents=True, exist_ok=True)
 
         generated = {}
@@ -93,18 +93,26 @@ class PlaylistGenerator:
         try:
             playlist_items = []
 
+            # Entry fields that only depend on the system, resolved once per system
+            cores = self.config.get("cores")
+            system_fields = {}
+            get_runtime_rom_path = self.config.get_runtime_rom_path
+
             for rom in roms:
                 # Get core info for this ROM's system
-                core_config = None
-                for system, config in self.config.get("cores").items():
-                    if system == rom.system:
-                        core_config = config
-                        break
-
-                if not core_config:
+                if rom.system not in system_fields:
+                    core_config = cores.get(rom.system)
+                    system_fields[rom.system] = (
+                        (core_config["core_name"], core_config.get("db_name", "")) if core_config else None
+                    )
+                fields = system_fields[rom.system]
+
+                if not fields:
                     print(f"Warning: No core configuration found for {rom.system}")
                     continue
 
+                core_name, db_name = fields
+
                 # Check if there's a manual match for this ROM
                 manual_match = None
                 if rom.crc32 and rom.crc32 in self.manual_matches:
@@ -136,16 +144,16 @@ class PlaylistGenerator:
                     crc32 = "DETECT"
 
                 # Convert local path to runtime path for playlist
-                runtime_path = self.config.get_runtime_rom_path(rom.path)
+                runtime_path = get_runtime_rom_path(rom.path)
 
                 # Build playlist entry
                 entry = {
                     "path": runtime_path,
                     "label": label,
                     "core_path": "DETECT",  # Let RetroArch detect the core
-                    "core_name": core_config["core_name"],
+                    "core_name": core_name,
                     "crc32": crc32,
-                    "db_name": core_config.get("db_name", "")
+                    "db_name": db_name
                 }
 
                 playlist_items.append(entry)
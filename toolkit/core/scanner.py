@@ -3,12 +3,17 @@ ROM Scanner Module
 Scans directories for ROM files
 """
 
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import List, Dict, Optional, Callable, TYPE_CHECKING
-import json
+from typing import List, Dict, Optional, Callable, Iterator, TYPE_CHECKING
+import os
 
-from .utils import calculate_crc32, normalize_rom_name, is_hack_version, extract_region_info, format_file_size
+from .utils import (calculate_crc32, normalize_rom_name, is_hack_version, extract_region_info, format_file_size,
+                    load_json_file, save_json_file)
 from .models import ROMInfo
+from .crc_cache import CRCCache
 
 # Use TYPE_CHECKING to avoid circular imports at runtime
 if TYPE_CHECKING:
@@ -29,10 +34,15 @@ class ROMScanner:
         self.roms: List[ROMInfo] = []
         self.matcher: Optional[ROMMatcher] = None
         self.playlist_generator: Optional[PlaylistGenerator] = None
-        self.unmatched_roms_file = Path(self.config.get("unknown_games_db", "unknown_games.json"))
+        self.unmatched_roms_file = self.config.unknown_games_db
+        self.crc_cache: Optional[CRCCache] = None
+        self._crc_workers = 1  # Threads per large file (see calculate_crc32)
 
     def scan(self, path: Optional[str] = None, recursive: bool = True,
-             calculate_crc: bool = True, progress_callback: Optional[Callable] = None) -> List[ROMInfo]:
+             calculate_crc: bool = True, progress_callback: Optional[Callable] = None,
+             jobs: Optional[int] = None, parallel_per_file: bool = False,
+             use_cache: bool = True, matcher: Optional['ROMMatcher'] = None,
+             auto_rename: bool = False) -> List[ROMInfo]:
         """Scan directory for ROM files
 
         Args:
@@ -40,12 +50,21 @@ class ROMScanner:
             recursive: Scan subdirectories
             calculate_crc: Calculate CRC32 checksums
             progress_callback: Optional callback function(current, total, rom_info)
+            jobs: Number of worker threads used to read and hash ROM files
+                  (uses config scan_options.jobs, then the CPU count, if None)
+            parallel_per_file: Also split large files into parts hashed by jobs threads
+            use_cache: Reuse and update the persistent CRC32 cache
+            matcher: Match each ROM as soon as it is hashed (while later files
+                     are still being hashed) instead of in a separate pass
+            auto_rename: Rename ROMs matched by matcher to their game names
 
         Returns:
             List of ROMInfo objects
         """
         if path is None:
             path = self.config.get("roms_path")
+        if jobs is None:
+            jobs = self.config.get("scan_options.jobs") or os.cpu_count() or 1
 
         scan_path = Path(path)
         if not scan_path.exists():
@@ -55,16 +74,10 @@ class ROMScanner:
         print(f"Scanning directory: {scan_path}")
 
         # Get all supported extensions
-        supported_extensions = set(self.config.get_all_extensions())
+        supported_extensions = self.config.get_all_extensions_set()
 
-        # Find all ROM files
-        rom_files = []
-        if recursive:
-            for ext in supported_extensions:
-                rom_files.extend(scan_path.rglob(f"*{ext}"))
-        else:
-            for ext in supported_extensions:
-                rom_files.extend(scan_path.glob(f"*{ext}"))
+        # Find all ROM files in a single directory walk
+        rom_files = list(self._iter_rom_files(scan_path, supported_extensions, recursive))
 
         # Filter out macOS temporary files (._filename) and hidden files
         rom_files_filtered = []
@@ -84,21 +97,70 @@ class ROMScanner:
         rom_files = rom_files_filtered
         print(f"Found {len(rom_files)} ROM files")
 
-        # Process each ROM
+        # Reuse CRC32 checksums of files unchanged since the last scan
+        self.crc_cache = None
+        if calculate_crc and use_cache:
+            self.crc_cache = CRCCache(self.config.get("crc_cache_db", "crc_cache.json"))
+        self._crc_workers = max(1, jobs) if parallel_per_file else 1
+
+        # Process each ROM (CRC32 is I/O bound and zlib releases the GIL,
+        # so files are hashed in parallel; map() keeps results in scan order)
         self.roms = []
-        for idx, rom_path in enumerate(rom_files, 1):
-            if progress_callback:
-                progress_callback(idx, len(rom_files), None)
+        if matcher:
+            manual_matches = matcher.load_manual_matches()
+            match_stats = Counter()
+        process_rom = partial(self._process_rom, calculate_crc=calculate_crc)
+        with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+            for idx, rom_info in enumerate(executor.map(process_rom, rom_files), 1):
+                if progress_callback:
+                    progress_callback(idx, len(rom_files), None)
 
-            rom_info = self._process_rom(rom_path, calculate_crc)
-            if rom_info:
-                self.roms.append(rom_info)
+                if rom_info:
+                    self.roms.append(rom_info)
+                    if matcher:
+                        matcher.match_scanned_rom(rom_info, manual_matches, match_stats, auto_rename)
 
-                if progress_callback:
-                    progress_callback(idx, len(rom_files), rom_info)
+                    if progress_callback:
+                        progress_callback(idx, len(rom_files), rom_info)
+
+        if matcher:
+            matcher.report_match_stats(match_stats, len(self.roms), auto_rename)
+
+        if self.crc_cache:
+            # Forget files removed from the scanned directory
+            self.crc_cache.prune(os.path.abspath(scan_path), (os.path.abspath(p) for p in rom_files))
+            self.crc_cache.save()
 
         return self.roms
 
+    def _iter_rom_files(self, root: Path, extensions: frozenset, recursive: bool = True) -> Iterator[Path]:
+        """Walk a directory tree and yield files with supported extensions
+
+        Uses os.scandir so file type checks come from the directory entry
+        instead of an extra stat() per file.
+
+        Args:
+            root: Directory to walk
+            extensions: Lowercase file extensions to match (e.g., '.nes')
+            recursive: Descend into subdirectories
+
+        Yields:
+            Path of each matching file
+        """
+        pending = [str(root)]
+        while pending:
+            directory = pending.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if recursive:
+                                pending.append(entry.path)
+                        elif os.path.splitext(entry.name)[1].lower() in extensions and entry.is_file():
+                            yield Path(entry.path)
+            except OSError as e:
+                print(f"Warning: Cannot read directory {directory}: {e}")
+
     def _process_rom(self, rom_path: Path, calculate_crc: bool) -> Optional[ROMInfo]:
         """Process a single ROM file
 
@@ -111,7 +173,8 @@ class ROMScanner:
         """
         try:
             # Get file info
-            file_size = rom_path.stat().st_size
+            stat = rom_path.stat()
+            file_size = stat.st_size
             extension = rom_path.suffix.lower()
 
             # Find matching system
@@ -125,7 +188,7 @@ class ROMScanner:
             # Calculate CRC32 if requested
             crc32 = None
             if calculate_crc:
-                crc32 = calculate_crc32(rom_path)
+                crc32 = self._get_crc32(rom_path, stat)
 
             # Normalize name and detect hacks
             normalized_name = normalize_rom_name(rom_path.name)
@@ -154,6 +217,27 @@ class ROMScanner:
             print(f"Error processing {rom_path}: {e}")
             return None
 
+    def _get_crc32(self, rom_path: Path, stat: os.stat_result) -> Optional[str]:
+        """Get CRC32 for a ROM file, using the CRC cache when possible
+
+        Args:
+            rom_path: Path to ROM file
+            stat: Result of stat() on the ROM file
+
+        Returns:
+            CRC32 hex string, or None if error
+        """
+        if self.crc_cache is None:
+            return calculate_crc32(rom_path, self._crc_workers)
+
+        cache_key = os.path.abspath(rom_path)
+        crc32 = self.crc_cache.get(cache_key, stat.st_size, stat.st_mtime_ns)
+        if crc32 is None:
+            crc32 = calculate_crc32(rom_path, self._crc_workers)
+            if crc32:
+                self.crc_cache.put(cache_key, stat.st_size, stat.st_mtime_ns, crc32)
+        return crc32
+
     def get_roms_by_system(self) -> Dict[str, List[ROMInfo]]:
         """Group ROMs by system
 
@@ -209,8 +293,7 @@ class ROMScanner:
                     "hacks": sum(1 for rom in roms if rom.is_hack)
                 }
 
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(output, f, indent=2, ensure_ascii=False)
+            save_json_file(output_path, output)
 
             print(f"Scan results exported to: {output_path}")
             return True
@@ -310,8 +393,7 @@ class ROMScanner:
             # Load existing unmatched games if file exists
             existing_data = {}
             if self.unmatched_roms_file.exists():
-                with open(self.unmatched_roms_file, 'r', encoding='utf-8') as f:
-                    existing_data = json.load(f)
+                existing_data = load_json_file(self.unmatched_roms_file)
 
             # Add new unmatched ROMs
             for rom in unmatched_roms:
@@ -339,8 +421,7 @@ class ROMScanner:
                     }
 
             # Save to file
-            with open(self.unmatched_roms_file, 'w', encoding='utf-8') as f:
-                json.dump(existing_data, f, indent=2, ensure_ascii=False)
+            save_json_file(self.unmatched_roms_file, existing_data)
 
             print(f"\n📝 Saved {len(unmatched_roms)} unmatched ROMs to: {self.unmatched_roms_file}")
             print("   You can manually edit this file to add game information")
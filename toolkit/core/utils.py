@@ -2,18 +2,54 @@
 Core utility functions for ROM processing
 """
 
+import json
+import mmap
 import re
 import zlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Any, List, Optional, Tuple
 import zipfile
 
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the stdlib json module
+    orjson = None
 
-def calculate_crc32(file_path: Path) -> Optional[str]:
+try:
+    # Intel ISA-L: PCLMULQDQ-folded IEEE CRC32, same signature as zlib.crc32
+    from isal.isal_zlib import crc32 as _crc32
+except ImportError:  # Optional: falls back to the zlib module
+    _crc32 = zlib.crc32
+
+# Chunk size for CRC32 calculation (large enough for zlib to release the GIL)
+CRC_CHUNK_SIZE = 1024 * 1024
+
+# Memory-mapped files are hashed in windows of this size (one call for smaller files)
+CRC_MMAP_WINDOW = 16 * 1024 * 1024
+
+# Files at least this large may be hashed in parallel parts (see crc32_combine)
+PARALLEL_CRC_MIN_SIZE = 64 * 1024 * 1024
+
+# Arcade-based systems (Neo Geo, MAME, FBNeo) whose ROMs require specific filenames
+ARCADE_SYSTEMS = frozenset({
+    "SNK - Neo Geo",
+    "MAME",
+    "FBNeo - Arcade Games",
+    "Arcade"
+})
+
+
+def calculate_crc32(file_path: Path, workers: int = 1) -> Optional[str]:
     """Calculate CRC32 checksum for a file
 
+    Always the IEEE CRC32 used by RetroArch databases: the same value keys
+    unknown_games.json / manual_matches.json and is looked up again from
+    rom.crc32 on later scans, so it cannot be swapped for CRC32C.
+
     Args:
         file_path: Path to the file
+        workers: Threads used to hash parts of files >= PARALLEL_CRC_MIN_SIZE
 
     Returns:
         CRC32 checksum as hex string, or None if error
@@ -25,18 +61,120 @@ def calculate_crc32(file_path: Path) -> Optional[str]:
         elif file_path.suffix.lower() == '.7z':
             return _calculate_crc32_7z(file_path)
         else:
-            return _calculate_crc32_file(file_path)
+            return _calculate_crc32_file(file_path, workers)
     except Exception as e:
         print(f"Error calculating CRC32 for {file_path}: {e}")
         return None
 
 
-def _calculate_crc32_file(file_path: Path) -> str:
-    """Calculate CRC32 for a regular file"""
+def _gf2_matrix_times(mat: List[int], vec: int) -> int:
+    """Multiply a 32x32 GF(2) matrix by a vector"""
+    total = 0
+    row = 0
+    while vec:
+        if vec & 1:
+            total ^= mat[row]
+        vec >>= 1
+        row += 1
+    return total
+
+
+def _gf2_matrix_square(mat: List[int]) -> List[int]:
+    """Square a 32x32 GF(2) matrix"""
+    return [_gf2_matrix_times(mat, mat[n]) for n in range(32)]
+
+
+def crc32_combine(crc1: int, crc2: int, len2: int) -> int:
+    """Combine two CRC32 checksums (port of zlib's crc32_combine)
+
+    Args:
+        crc1: CRC32 of the first block
+        crc2: CRC32 of the second block
+        len2: Length of the second block in bytes
+
+    Returns:
+        CRC32 of the two blocks concatenated
+    """
+    if len2 <= 0:
+        return crc1
+
+    # Operator for one zero bit, then squared to two and four zero bits
+    odd = [0xEDB88320] + [1 << n for n in range(31)]
+    even = _gf2_matrix_square(odd)
+    odd = _gf2_matrix_square(even)
+
+    # Apply len2 zero bytes to crc1 (first square puts the operator for one zero byte in even)
+    while True:
+        even = _gf2_matrix_square(odd)
+        if len2 & 1:
+            crc1 = _gf2_matrix_times(even, crc1)
+        len2 >>= 1
+        if not len2:
+            break
+
+        odd = _gf2_matrix_square(even)
+        if len2 & 1:
+            crc1 = _gf2_matrix_times(odd, crc1)
+        len2 >>= 1
+        if not len2:
+            break
+
+    return crc1 ^ crc2
+
+
+def _calculate_crc32_parts(view: memoryview, workers: int) -> int:
+    """Calculate CRC32 of a buffer by hashing parts in parallel
+
+    Args:
+        view: Buffer to hash
+        workers: Number of parts / threads
+
+    Returns:
+        CRC32 of the whole buffer
+    """
+    part_size = -(-len(view) // workers)
+    parts = [view[offset:offset + part_size] for offset in range(0, len(view), part_size)]
+
+    # The CRC32 routine releases the GIL, so the parts are hashed concurrently
+    with ThreadPoolExecutor(max_workers=len(parts)) as executor:
+        part_crcs = list(executor.map(_crc32, parts))
+
+    crc = part_crcs[0]
+    for part, part_crc in zip(parts[1:], part_crcs[1:]):
+        crc = crc32_combine(crc, part_crc, len(part))
+    return crc
+
+
+def _calculate_crc32_file(file_path: Path, workers: int = 1) -> str:
+    """Calculate CRC32 for a regular file
+
+    Memory-maps the file and feeds zero-copy slices to the CRC32 routine, falling
+    back to buffered reads where mmap is unavailable (e.g. empty files).
+    Large files are split into parts hashed in parallel when workers > 1.
+    """
     crc = 0
     with open(file_path, 'rb') as f:
-        while chunk := f.read(65536):  # Read in 64KB chunks
-            crc = zlib.crc32(chunk, crc)
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            mm = None
+
+        if mm is None:
+            while chunk := f.read(CRC_CHUNK_SIZE):
+                crc = _crc32(chunk, crc)
+        else:
+            # Hint the kernel to read ahead aggressively for the linear scan,
+            # and to start reading files that fit in one window right away
+            if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            if hasattr(mmap, 'MADV_WILLNEED') and len(mm) <= CRC_MMAP_WINDOW:
+                mm.madvise(mmap.MADV_WILLNEED)
+            with mm, memoryview(mm) as view:
+                if workers > 1 and len(view) >= PARALLEL_CRC_MIN_SIZE:
+                    crc = _calculate_crc32_parts(view, workers)
+                else:
+                    for offset in range(0, len(view), CRC_MMAP_WINDOW):
+                        crc = _crc32(view[offset:offset + CRC_MMAP_WINDOW], crc)
     return f"{crc & 0xFFFFFFFF:08x}".upper()
 
 
@@ -69,7 +207,7 @@ def _calculate_crc32_7z(file_path: Path) -> Optional[str]:
                 if Path(name).suffix.lower() in rom_extensions:
                     crc = 0
                     data = bio.read()
-                    crc = zlib.crc32(data, crc)
+                    crc = _crc32(data, crc)
                     return f"{crc & 0xFFFFFFFF:08x}".upper()
         return None
     except ImportError:
@@ -80,6 +218,40 @@ def _calculate_crc32_7z(file_path: Path) -> Optional[str]:
         return None
 
 
+def load_json_file(file_path: Path) -> Any:
+    """Load a JSON data file, using orjson when it is installed
+
+    Args:
+        file_path: Path to the JSON file
+
+    Returns:
+        Parsed JSON data
+    """
+    data = Path(file_path).read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def save_json_file(file_path: Path, data: Any, indent: bool = True) -> None:
+    """Save data as UTF-8 JSON, using orjson when it is installed
+
+    Args:
+        file_path: Path to the JSON file
+        data: JSON-serializable data
+        indent: Indent with 2 spaces (compact output if False)
+    """
+    if orjson is not None:
+        with open(file_path, 'wb') as f:
+            # OPT_NON_STR_KEYS converts int keys to strings like json.dump does
+            option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+            f.write(orjson.dumps(data, option=option))
+        return
+
+    with open(file_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2 if indent else None, ensure_ascii=False)
+
+
 def normalize_rom_name(filename: str) -> str:
     """Normalize ROM filename for matching
 
@@ -225,17 +397,8 @@ def rename_rom(rom_info, new_name: str, dry_run: bool = False) -> Tuple[bool, Op
         Tuple of (success, new_path or error_message)
     """
     try:
-        # Check if system is arcade-based (Neo Geo, MAME, FBNeo)
-        # These systems require specific ROM filenames and should not be renamed
-        arcade_systems = [
-            "SNK - Neo Geo",
-            "MAME",
-            "FBNeo - Arcade Games",
-            "Arcade"
-        ]
-
-        # Check if the ROM's system is in the arcade systems list
-        if rom_info.system in arcade_systems:
+        # Arcade systems require specific ROM filenames and should not be renamed
+        if rom_info.system in ARCADE_SYSTEMS:
             return False, f"Skipped: {rom_info.system} ROMs require specific filenames and cannot be renamed"
 
         current_path = Path(rom_info.path)
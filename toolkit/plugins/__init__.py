@@ -3,16 +3,31 @@ RetroArch Toolkit Plugins Module
 Provides extensible plugin system for fetching game data from various sources
 """
 
-from ..core.fetcher import BaseFetcher, FetchResult, FetchPlugin
-from .retroarch_db import RetroArchDBFetcher
-from .libretro_thumbnails import LibretroThumbnailsFetcher
-from .launchbox import LaunchBoxFetcher
+import importlib
 
-__all__ = [
-    'BaseFetcher',
-    'FetchResult',
-    'FetchPlugin',
-    'RetroArchDBFetcher',
-    'LibretroThumbnailsFetcher',
-    'LaunchBoxFetcher'
-]
+# Public names and the module defining them. Plugin modules are imported on
+# first access so that loading one plugin does not import the others.
+_EXPORTS = {
+    'BaseFetcher': '..core.fetcher',
+    'FetchResult': '..core.fetcher',
+    'FetchPlugin': '..core.fetcher',
+    'RetroArchDBFetcher': '.retroarch_db',
+    'LibretroThumbnailsFetcher': '.libretro_thumbnails',
+    'LaunchBoxFetcher': '.launchbox',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    """Import the module exporting name on first access"""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
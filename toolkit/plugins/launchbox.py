@@ -3,13 +3,14 @@ LaunchBox Games DB Fetcher
 Fetches game information from LaunchBox Games Database API
 """
 
-import urllib.request
+import urllib.error
 import urllib.parse
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, List
 
-from ..core.fetcher import FetchPlugin, FetchResult
+from ..core.fetcher import FetchPlugin, FetchResult, open_url
 
 
 class LaunchBoxFetcher(FetchPlugin):
@@ -65,11 +66,12 @@ class LaunchBoxFetcher(FetchPlugin):
             api_url = f"https://api.gamesdb.launchbox-app.com/api/search/{encoded_query}"
 
             # Make request
-            request = urllib.request.Request(api_url)
-            request.add_header('User-Agent', 'Retroarch-Playlist-Tools/1.0')
-            request.add_header('Accept', 'application/json')
+            headers = {
+                'User-Agent': 'Retroarch-Playlist-Tools/1.0',
+                'Accept': 'application/json',
+            }
 
-            with urllib.request.urlopen(request, timeout=15) as response:
+            with open_url(api_url, headers=headers, timeout=15) as response:
                 data = json.loads(response.read().decode('utf-8'))
 
             # Extract games from response
@@ -133,7 +135,7 @@ class LaunchBoxFetcher(FetchPlugin):
 
         # Setup cache directory
         cache_dir = self.cache_dir / "launchbox" / "html_cache"
-        cache_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(cache_dir)
 
         # Cache file based on game_id
         cache_file = cache_dir / f"{game_id}.html"
@@ -167,12 +169,13 @@ class LaunchBoxFetcher(FetchPlugin):
                 url = f"{self.base_url}/games/details/{game_id}"
 
                 # Make request to get HTML page
-                request = urllib.request.Request(url)
-                request.add_header('User-Agent', 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36')
-                request.add_header('Accept', 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8')
-                request.add_header('Accept-Language', 'en-US,en;q=0.9')
+                headers = {
+                    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+                    'Accept-Language': 'en-US,en;q=0.9',
+                }
 
-                with urllib.request.urlopen(request, timeout=30) as response:
+                with open_url(url, headers=headers, timeout=30) as response:
                     html_content = response.read().decode('utf-8')
 
                 # Cache the HTML content
@@ -294,7 +297,7 @@ class LaunchBoxFetcher(FetchPlugin):
         if output_dir is None:
             output_dir = self.cache_dir / "launchbox" / "images"
 
-        output_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(output_dir)
 
         # Default to all image types if not specified
         if image_types is None:
@@ -329,7 +332,8 @@ class LaunchBoxFetcher(FetchPlugin):
 
             # If all images exist, skip fetching game info
             if all_exist and existing_paths:
-                print(f"  ⊙ All images already exist, skipping download")
+                if self.show_progress:
+                    print(f"  ⊙ All images already exist, skipping download")
                 return FetchResult(
                     success=True,
                     data={"paths": existing_paths, "count": len(existing_paths)},
@@ -344,6 +348,7 @@ class LaunchBoxFetcher(FetchPlugin):
 
             images_data = game_info.data.get("images", {})
             downloaded_paths = {}
+            pending = []  # (img_type, image_url, output_path) to download
 
             # Download each requested image type
             for img_type in image_types:
@@ -354,10 +359,12 @@ class LaunchBoxFetcher(FetchPlugin):
                 images_list = images_data.get(img_type, [])
 
                 if not images_list:
-                    print(f"  ⚠️  No {img_type} images found")
+                    if self.show_progress:
+                        print(f"  ⚠️  No {img_type} images found")
                     continue
 
-                print(f"  Found {len(images_list)} {img_type} image(s)")
+                if self.show_progress:
+                    print(f"  Found {len(images_list)} {img_type} image(s)")
 
                 # Filter and sort images based on type
                 if img_type == "box_front":
@@ -375,7 +382,8 @@ class LaunchBoxFetcher(FetchPlugin):
                         if img.get("width", 0) <= 1000
                     ]
                     if not filtered_images:
-                        print(f"  ⚠️  No {img_type} images with width <= 1000")
+                        if self.show_progress:
+                            print(f"  ⚠️  No {img_type} images with width <= 1000")
                         continue
                     # Prefer matching region
                     filtered_images.sort(key=lambda x: 0 if prefer_region in x.get("region", "") else 1)
@@ -394,25 +402,39 @@ class LaunchBoxFetcher(FetchPlugin):
 
                     # Create subdirectory for image type
                     type_dir = output_dir / dir_name
-                    type_dir.mkdir(parents=True, exist_ok=True)
+                    self._ensure_dir(type_dir)
 
                     # RetroArch thumbnails are always PNG
                     output_path = type_dir / f"{filename_base}.png"
 
                     # Skip if already downloaded
                     if output_path.exists():
-                        print(f"  ⊙ {img_type} already exists, skipping")
+                        if self.show_progress:
+                            print(f"  ⊙ {img_type} already exists, skipping")
                         downloaded_paths[img_type] = str(output_path)
                         continue
 
-                    print(f"  Downloading {img_type} from {image_url}")
-
-                    # Download and convert to PNG if needed
-                    if self._download_and_convert_image(image_url, output_path):
-                        downloaded_paths[img_type] = str(output_path)
-                        print(f"  ✓ Saved to {output_path}")
-                    else:
-                        print(f"  ✗ Failed to download {img_type}")
+                    if self.show_progress:
+                        print(f"  Downloading {img_type} from {image_url}")
+                    pending.append((img_type, image_url, output_path))
+
+            # Download and convert the selected images concurrently (one request per type);
+            # per-file spinners would interleave, so only show them for a single download
+            if pending:
+                def download(item) -> bool:
+                    _, image_url, output_path = item
+                    return self._download_and_convert_image(image_url, output_path,
+                                                            show_progress=self.show_progress and len(pending) == 1)
+
+                with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+                    for (img_type, _, output_path), success in zip(pending, executor.map(download, pending)):
+                        if success:
+                            downloaded_paths[img_type] = str(output_path)
+                            if self.show_progress:
+                                print(f"  ✓ Saved to {output_path}")
+                        else:
+                            if self.show_progress:
+                                print(f"  ✗ Failed to download {img_type}")
 
             if downloaded_paths:
                 return FetchResult(
@@ -434,12 +456,14 @@ class LaunchBoxFetcher(FetchPlugin):
                 source=self.PLUGIN_NAME
             )
 
-    def _download_and_convert_image(self, image_url: str, output_path: Path) -> bool:
+    def _download_and_convert_image(self, image_url: str, output_path: Path,
+                                    show_progress: Optional[bool] = None) -> bool:
         """Download image and convert to PNG if needed
 
         Args:
             image_url: URL of the image
             output_path: Output path (should end with .png)
+            show_progress: Show download progress (defaults to self.show_progress)
 
         Returns:
             True if successful
@@ -448,7 +472,7 @@ class LaunchBoxFetcher(FetchPlugin):
             # Download to temporary location first
             temp_path = output_path.with_suffix('.tmp')
 
-            if not self.download_file(image_url, temp_path):
+            if not self.download_file(image_url, temp_path, show_progress=show_progress):
                 return False
 
             # Check if conversion is needed (JPG to PNG)
@@ -5,11 +5,14 @@ Downloads game thumbnails from thumbnails.libretro.com
 
 import urllib.request
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, List
 import re
+import time
 
 from ..core.fetcher import FetchPlugin, FetchResult
+from ..core.utils import load_json_file, save_json_file
 
 
 class LibretroThumbnailsFetcher(FetchPlugin):
@@ -20,6 +23,9 @@ class LibretroThumbnailsFetcher(FetchPlugin):
     # Thumbnail types
     THUMBNAIL_TYPES = ["Named_Boxarts", "Named_Snaps", "Named_Titles"]
 
+    # Thumbnails that returned 404 are not requested again for this long (seconds)
+    MISS_TTL = 7 * 24 * 60 * 60
+
     def __init__(self, config: dict):
         """Initialize Libretro Thumbnails fetcher
 
@@ -28,6 +34,9 @@ class LibretroThumbnailsFetcher(FetchPlugin):
         """
         super().__init__(config)
         self.base_url = config.get("base_url", "http://thumbnails.libretro.com")
+        self.misses_path = self.cache_dir / "thumbnail_misses.json"
+        self._miss_times = self._load_misses()
+        self.not_found_urls.update(self._miss_times)
 
     def get_name(self) -> str:
         """Get plugin name"""
@@ -59,7 +68,7 @@ class LibretroThumbnailsFetcher(FetchPlugin):
         if output_dir is None:
             output_dir = self.cache_dir / "thumbnails" / system / thumbnail_type
 
-        output_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(output_dir)
 
         # Sanitize game name for filename
         safe_game_name = self._sanitize_thumbnail_name(game_name)
@@ -70,20 +79,10 @@ class LibretroThumbnailsFetcher(FetchPlugin):
         # Try different image extensions
         extensions = [".png", ".jpg"]
 
+        # Check every cached format before making any request
         for ext in extensions:
-            # Construct URL using the game_name (for searching in libretro)
-            search_filename = f"{safe_game_name}{ext}"
-            encoded_system = urllib.parse.quote(system)
-            encoded_type = urllib.parse.quote(thumbnail_type)
-            encoded_name = urllib.parse.quote(search_filename)
-            url = f"{self.base_url}/{encoded_system}/{encoded_type}/{encoded_name}"
-
-            # Save with custom filename
-            output_filename_full = f"{output_file_base}{ext}"
-            output_path = output_dir / output_filename_full
-
-            # Check if already cached
-            if output_path.exists():
+            output_path = output_dir / f"{output_file_base}{ext}"
+            if self._file_exists(output_path):
                 return FetchResult(
                     success=True,
                     data={
@@ -95,6 +94,18 @@ class LibretroThumbnailsFetcher(FetchPlugin):
                     cached=True
                 )
 
+        for ext in extensions:
+            # Construct URL using the game_name (for searching in libretro)
+            search_filename = f"{safe_game_name}{ext}"
+            encoded_system = urllib.parse.quote(system)
+            encoded_type = urllib.parse.quote(thumbnail_type)
+            encoded_name = urllib.parse.quote(search_filename)
+            url = f"{self.base_url}/{encoded_system}/{encoded_type}/{encoded_name}"
+
+            # Save with custom filename
+            output_filename_full = f"{output_file_base}{ext}"
+            output_path = output_dir / output_filename_full
+
             # Try to download
             if self.download_file(url, output_path):
                 return FetchResult(
@@ -133,6 +144,33 @@ class LibretroThumbnailsFetcher(FetchPlugin):
 
         return results
 
+    def download_thumbnails(self, system: str, game_name: str,
+                            thumbnail_types: Optional[List[str]] = None,
+                            output_dir: Optional[Path] = None,
+                            output_filename: Optional[str] = None) -> dict:
+        """Download several thumbnail types for a game concurrently
+
+        Args:
+            system: System name
+            game_name: Game name (must match database name)
+            thumbnail_types: Types to download (all if None)
+            output_dir: Base output directory, one subdirectory per type (uses cache if None)
+            output_filename: Override output filename (without extension)
+
+        Returns:
+            Dictionary mapping thumbnail type to FetchResult, in thumbnail_types order
+        """
+        if thumbnail_types is None:
+            thumbnail_types = self.THUMBNAIL_TYPES
+
+        def download(thumbnail_type: str) -> FetchResult:
+            type_output_dir = output_dir / thumbnail_type if output_dir else None
+            return self.download_thumbnail(system, game_name, thumbnail_type, type_output_dir, output_filename)
+
+        # Each type is an independent request, so fetch them all at once
+        with ThreadPoolExecutor(max_workers=max(1, len(thumbnail_types))) as executor:
+            return dict(zip(thumbnail_types, executor.map(download, thumbnail_types)))
+
     def batch_download_thumbnails(self, system: str, game_names: List[str],
                                  thumbnail_types: Optional[List[str]] = None,
                                  output_dir: Optional[Path] = None) -> dict:
@@ -172,6 +210,38 @@ class LibretroThumbnailsFetcher(FetchPlugin):
 
         return results
 
+    def _load_misses(self) -> dict:
+        """Load thumbnail URLs recently found missing (404)
+
+        Returns:
+            Dictionary mapping URL to the time it was found missing
+        """
+        if not self.misses_path.exists():
+            return {}
+
+        try:
+            misses = load_json_file(self.misses_path)
+        except Exception as e:
+            print(f"Warning: Failed to load thumbnail misses: {e}")
+            return {}
+
+        now = time.time()
+        return {url: found for url, found in misses.items() if now - found < self.MISS_TTL}
+
+    def save_misses(self):
+        """Persist thumbnail URLs found missing so later runs skip them"""
+        if self.not_found_urls.issubset(self._miss_times):
+            return
+
+        now = time.time()
+        for url in self.not_found_urls:
+            self._miss_times.setdefault(url, now)
+
+        try:
+            save_json_file(self.misses_path, self._miss_times)
+        except Exception as e:
+            print(f"Warning: Failed to save thumbnail misses: {e}")
+
     def _sanitize_thumbnail_name(self, game_name: str) -> str:
         """Sanitize game name for thumbnail filename
 
@@ -61,12 +61,14 @@ class RetroArchDBFetcher(FetchPlugin):
         """Get plugin name"""
         return self.PLUGIN_NAME
 
-    def download_database(self, db_name: str, output_dir: Optional[Path] = None) -> FetchResult:
+    def download_database(self, db_name: str, output_dir: Optional[Path] = None,
+                          update: bool = False) -> FetchResult:
         """Download a RetroArch database file
 
         Args:
             db_name: Database filename (e.g., "Nintendo - Nintendo Entertainment System.rdb")
             output_dir: Output directory (uses cache if None)
+            update: Re-check an existing file with the server and download it only if it changed
 
         Returns:
             FetchResult with download status
@@ -74,11 +76,11 @@ class RetroArchDBFetcher(FetchPlugin):
         if output_dir is None:
             output_dir = self.cache_dir / "databases"
 
-        output_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(output_dir)
         output_path = output_dir / db_name
 
         # Check if already cached
-        if output_path.exists():
+        if output_path.exists() and not update:
             file_size = output_path.stat().st_size
             # Use the _format_size from parent class
             from ..core.utils import format_file_size
@@ -95,15 +97,17 @@ class RetroArchDBFetcher(FetchPlugin):
         encoded_name = urllib.parse.quote(db_name)
         url = f"{self.base_url}/{encoded_name}"
 
-        # Download file with progress (inline display)
-        if self.download_file(url, output_path, show_progress=True):
+        # Download file with progress (inline display); validators are kept so
+        # a later update only transfers databases that changed
+        if self.download_file(url, output_path, show_progress=True, conditional=True):
             file_size = output_path.stat().st_size
             from ..core.utils import format_file_size
             size_str = format_file_size(file_size)
             return FetchResult(
                 success=True,
                 data={"path": str(output_path), "size": file_size, "size_str": size_str},
-                source=self.PLUGIN_NAME
+                source=self.PLUGIN_NAME,
+                cached=url in self.not_modified_urls
             )
         else:
             return FetchResult(
@@ -113,12 +117,14 @@ class RetroArchDBFetcher(FetchPlugin):
             )
 
     def download_all_databases(self, output_dir: Optional[Path] = None,
-                               systems: Optional[List[str]] = None) -> dict:
+                               systems: Optional[List[str]] = None,
+                               update: bool = False) -> dict:
         """Download multiple database files
 
         Args:
             output_dir: Output directory
             systems: List of system names to download (downloads all if None)
+            update: Re-check existing files and download only those that changed
 
         Returns:
             Dictionary mapping database name to FetchResult
@@ -148,7 +154,7 @@ class RetroArchDBFetcher(FetchPlugin):
             # Display file name on its own line
             print(f"[{idx}/{len(databases_to_download)}] {db_name}")
 
-            result = self.download_database(db_name, output_dir)
+            result = self.download_database(db_name, output_dir, update=update)
             results[db_name] = result
 
             if result.success: